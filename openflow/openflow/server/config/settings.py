@@ -54,6 +54,10 @@ class Settings(BaseSettings):
     cors_allow_methods: list[str] = ["*"]
     cors_allow_headers: list[str] = ["*"]
 
+    # Response compression
+    gzip_minimum_size: int = 1024  # Smaller responses are sent uncompressed
+    gzip_compress_level: int = 4
+
     # File uploads
     max_upload_size: int = 10 * 1024 * 1024  # 10MB
     allowed_file_extensions: list[str] = [
@@ -3,7 +3,7 @@ OpenFlow Module System
 
 Provides automatic module loading, dependency resolution, and module lifecycle management.
 """
-from .loader import ModuleLoader, ModuleGraph
+from .loader import ModuleLoader, ModuleGraph, CircularDependencyError, MissingDependencyError
 from .module import Module, ModuleManifest, ModuleState
 from .registry import ModuleRegistry, module_registry
 from .data_loader import DataLoader, ExternalIdManager
@@ -11,6 +11,8 @@ from .data_loader import DataLoader, ExternalIdManager
 __all__ = [
     'ModuleLoader',
     'ModuleGraph',
+    'CircularDependencyError',
+    'MissingDependencyError',
     'Module',
     'ModuleManifest',
     'ModuleState',
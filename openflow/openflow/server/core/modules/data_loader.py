@@ -5,14 +5,37 @@ Loads module data files (CSV and XML) into the database.
 """
 import csv
 import logging
+import sys
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import xml.etree.ElementTree as ET
 from sqlalchemy.ext.asyncio import AsyncSession
 
+try:
+    from lxml import etree as LET
+except ImportError:
+    LET = None
+
 logger = logging.getLogger(__name__)
 
 
+def _iterparse(file_path: Path):
+    """
+    Stream start/end events for an XML data file
+
+    Uses lxml's C parser when it is installed, skipping comments and ID
+    collection, and falls back to the standard library otherwise.
+    """
+    if LET is not None:
+        return LET.iterparse(
+            str(file_path),
+            events=('start', 'end'),
+            remove_comments=True,
+            collect_ids=False,
+        )
+    return ET.iterparse(file_path, events=('start', 'end'))
+
+
 class DataLoader:
     """
     Loads data files from modules
@@ -47,16 +70,20 @@ class DataLoader:
             return
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                records = list(reader)
+            count = 0
+            debug = logger.isEnabledFor(logging.DEBUG)
+
+            # Stream rows instead of reading the whole file into a list
+            with open(file_path, 'r', encoding='utf-8', newline='', buffering=1 << 20) as f:
+                for record in csv.DictReader(f):
+                    count += 1
 
-            logger.info(f"Loaded {len(records)} records from {file_path.name}")
+                    # TODO: Create records in database
+                    # This requires integration with the ORM
+                    if debug:
+                        logger.debug(f"Record: {record}")
 
-            # TODO: Create records in database
-            # This requires integration with the ORM
-            for record in records:
-                logger.debug(f"Record: {record}")
+            logger.info(f"Loaded {count} records from {file_path.name}")
 
         except Exception as e:
             logger.error(f"Failed to load CSV file {file_path}: {e}")
@@ -77,20 +104,30 @@ class DataLoader:
             return
 
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
+            # Stream the document so only one <record> is held in memory at a time
+            tags: List[str] = []
+            noupdate_stack: List[bool] = []
 
-            # Process <data> elements
-            for data_elem in root.findall('data'):
-                noupdate = data_elem.get('noupdate', '0') == '1'
+            for event, elem in _iterparse(file_path):
+                if event == 'start':
+                    if elem.tag == 'data':
+                        noupdate_stack.append(elem.get('noupdate', '0') == '1')
+                    tags.append(elem.tag)
+                    continue
 
-                # Process <record> elements
-                for record_elem in data_elem.findall('record'):
+                tags.pop()
+
+                # Process <record> elements of <data> blocks
+                if elem.tag == 'record' and tags and tags[-1] == 'data':
                     await self._process_record(
-                        record_elem,
+                        elem,
                         module_name,
-                        noupdate
+                        noupdate_stack[-1]
                     )
+                    elem.clear()
+                elif elem.tag == 'data':
+                    noupdate_stack.pop()
+                    elem.clear()
 
         except Exception as e:
             logger.error(f"Failed to load XML file {file_path}: {e}")
@@ -136,7 +173,8 @@ class DataLoader:
         # TODO: Create or update record in database
         # This requires integration with the ORM
 
-    def _parse_field_value(self, field_elem: ET.Element) -> Any:
+    @staticmethod
+    def _parse_field_value(field_elem: ET.Element) -> Any:
         """
         Parse field value from XML element
 
@@ -146,16 +184,18 @@ class DataLoader:
         Returns:
             Parsed field value
         """
+        attrib = field_elem.attrib
+
         # Check for 'eval' attribute (Python expression)
-        if field_elem.get('eval'):
-            eval_expr = field_elem.get('eval')
+        eval_expr = attrib.get('eval')
+        if eval_expr:
             # TODO: Safely evaluate Python expressions
             # For now, return as string
             return eval_expr
 
         # Check for 'ref' attribute (external ID reference)
-        if field_elem.get('ref'):
-            ref_id = field_elem.get('ref')
+        ref_id = attrib.get('ref')
+        if ref_id:
             # TODO: Resolve external ID to database ID
             return ref_id
 
@@ -222,8 +262,9 @@ class ExternalIdManager:
             Database ID or None if not found
         """
         # Check cache first
-        if external_id in self._cache:
-            return self._cache[external_id]
+        db_id = self._cache.get(external_id)
+        if db_id is not None:
+            return db_id
 
         # TODO: Query ir.model.data table
         # For now, return None
@@ -238,7 +279,7 @@ class ExternalIdManager:
             model: Model name
             db_id: Database ID
         """
-        self._cache[external_id] = db_id
+        self._cache[sys.intern(external_id)] = db_id
 
         # TODO: Insert into ir.model.data table
         logger.debug(f"Registered external ID: {external_id} -> {model}({db_id})")
@@ -3,9 +3,13 @@ Module Loader and Dependency Resolver
 
 Handles module discovery, dependency resolution, and loading order computation.
 """
+import heapq
 import importlib
+import os
 import sys
-from collections import defaultdict, deque
+from array import array
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Set, Optional
 import logging
@@ -30,16 +34,32 @@ class ModuleGraph:
     Dependency graph for modules with topological sort support
 
     Uses Kahn's algorithm for topological sorting to resolve dependencies.
+    Ready modules are taken in priority order - auto_install modules first,
+    then by name - so the load order is deterministic.
     """
 
     def __init__(self):
         self.graph: Dict[str, Set[str]] = defaultdict(set)
         self.in_degree: Dict[str, int] = defaultdict(int)
         self.modules: Dict[str, Module] = {}
+        # Dependencies not (yet) added as modules -> modules requiring them
+        self._pending_deps: Dict[str, Set[str]] = defaultdict(set)
+        # Integer-id snapshot of the graph used by topological_sort
+        self._names: List[str] = []
+        self._adj: List[List[int]] = []
+        self._indeg = array('i')
+        self._keys: List[tuple] = []
+        self._dirty = True
+        # Bumped on every change; keys the dependency chain cache
+        self.version = 0
+        self._chain_cache: Dict[tuple, List[str]] = {}
 
     def add_module(self, module: Module):
         """Add a module to the graph"""
         self.modules[module.name] = module
+        self._pending_deps.pop(module.name, None)
+        self._dirty = True
+        self.version += 1
 
         # Initialize the node if not exists
         if module.name not in self.graph:
@@ -48,6 +68,8 @@ class ModuleGraph:
 
         # Add dependencies
         for dep in module.manifest.depends:
+            if dep not in self.modules:
+                self._pending_deps[dep].add(module.name)
             self.add_dependency(dep, module.name)
 
     def add_dependency(self, from_module: str, to_module: str):
@@ -58,6 +80,29 @@ class ModuleGraph:
         if to_module not in self.graph[from_module]:
             self.graph[from_module].add(to_module)
             self.in_degree[to_module] += 1
+            self._dirty = True
+            self.version += 1
+
+    def _freeze(self):
+        """Snapshot the graph as integer node ids, adjacency lists and in-degrees"""
+        names = list(self.graph)
+        ids = {name: i for i, name in enumerate(names)}
+        graph = self.graph
+        in_degree = self.in_degree
+
+        self._names = names
+        self._adj = [[ids[n] for n in graph[name]] for name in names]
+        self._indeg = array('i', [in_degree[name] for name in names])
+        self._keys = [
+            (not self._auto_install(name), name, i)
+            for i, name in enumerate(names)
+        ]
+        self._dirty = False
+
+    def _auto_install(self, name: str) -> bool:
+        """Whether a graph node is an auto_install module"""
+        module = self.modules.get(name)
+        return bool(module and module.manifest.auto_install)
 
     def topological_sort(self) -> List[str]:
         """
@@ -70,44 +115,151 @@ class ModuleGraph:
             CircularDependencyError: If circular dependencies detected
             MissingDependencyError: If a dependency is missing
         """
-        # Verify all dependencies exist
-        for module_name, module in self.modules.items():
-            for dep in module.manifest.depends:
-                if dep not in self.modules:
-                    raise MissingDependencyError(
-                        f"Module '{module_name}' depends on '{dep}' which is not available"
-                    )
+        # Verify all dependencies exist (tracked while adding modules)
+        for dep, dependents in self._pending_deps.items():
+            raise MissingDependencyError(
+                f"Module '{min(dependents)}' depends on '{dep}' which is not available"
+            )
+
+        if self._dirty:
+            self._freeze()
 
         # Create a copy of in_degree for processing
-        in_degree_copy = self.in_degree.copy()
-        queue = deque()
+        names = self._names
+        adj = self._adj
+        indeg = array('i', self._indeg)
 
-        # Find all nodes with no incoming edges
-        for node in self.graph:
-            if in_degree_copy[node] == 0:
-                queue.append(node)
+        keys = self._keys
 
-        result = []
+        # Find all nodes with no incoming edges, ordered by priority
+        heap = [keys[i] for i, degree in enumerate(indeg) if degree == 0]
+        heapq.heapify(heap)
 
-        while queue:
-            # Remove a node from the queue
-            node = queue.popleft()
-            result.append(node)
+        order = []
+        append = order.append
+        heappop = heapq.heappop
+        heappush = heapq.heappush
+
+        while heap:
+            # Remove the highest priority node from the heap
+            node = heappop(heap)[2]
+            append(node)
 
             # For each neighbor of the removed node
-            for neighbor in self.graph[node]:
-                in_degree_copy[neighbor] -= 1
-                if in_degree_copy[neighbor] == 0:
-                    queue.append(neighbor)
+            for neighbor in adj[node]:
+                indeg[neighbor] -= 1
+                if indeg[neighbor] == 0:
+                    heappush(heap, keys[neighbor])
 
         # Check if all nodes were processed
-        if len(result) != len(self.graph):
-            # Find the cycle
-            remaining = set(self.graph.keys()) - set(result)
+        if len(order) != len(names):
+            # Only nodes on or behind a cycle keep a positive in-degree
+            remaining = [names[i] for i, degree in enumerate(indeg) if degree > 0]
+            cycle = self._find_cycle(remaining)
             raise CircularDependencyError(
-                f"Circular dependency detected involving modules: {remaining}"
+                f"Circular dependency detected involving modules: {' -> '.join(cycle)}"
             )
 
+        return [names[i] for i in order]
+
+    def _find_cycle(self, nodes: List[str]) -> List[str]:
+        """
+        Find a dependency cycle among the given nodes
+
+        Runs an iterative depth-first search, coloring nodes WHITE/GRAY/BLACK,
+        and stops at the first edge back to a GRAY node.
+
+        Args:
+            nodes: Candidate nodes, at least one of which is on a cycle
+
+        Returns:
+            Module names along the cycle, with the first repeated at the end
+        """
+        WHITE, GRAY, BLACK = 0, 1, 2
+        graph = self.graph
+        color: Dict[str, int] = {}
+
+        for root in nodes:
+            if color.get(root, WHITE) != WHITE:
+                continue
+
+            color[root] = GRAY
+            path = [root]
+            stack = [iter(graph[root])]
+
+            while stack:
+                for neighbor in stack[-1]:
+                    state = color.get(neighbor, WHITE)
+                    if state == GRAY:
+                        return path[path.index(neighbor):] + [neighbor]
+                    if state == WHITE:
+                        color[neighbor] = GRAY
+                        path.append(neighbor)
+                        stack.append(iter(graph[neighbor]))
+                        break
+                else:
+                    color[path.pop()] = BLACK
+                    stack.pop()
+
+        return list(nodes)
+
+    def dependency_order(self, module_names: List[str]) -> List[str]:
+        """
+        Get modules and all their dependencies in load order
+
+        Runs a single iterative depth-first search over the dependencies of
+        the given modules and emits them in post-order, so every module
+        comes after everything it depends on.
+
+        Args:
+            module_names: Names of the modules
+
+        Returns:
+            List of module names including dependencies in load order
+
+        Raises:
+            CircularDependencyError: If circular dependencies detected
+            MissingDependencyError: If a dependency is missing
+        """
+        WHITE, GRAY, BLACK = 0, 1, 2
+        modules = self.modules
+        color: Dict[str, int] = {}
+        result: List[str] = []
+
+        for root in module_names:
+            if root not in modules:
+                raise ValueError(f"Module '{root}' not found")
+            if color.get(root, WHITE) != WHITE:
+                continue
+
+            color[root] = GRAY
+            stack = [(root, iter(modules[root].manifest.depends))]
+
+            while stack:
+                name, deps = stack[-1]
+                for dep in deps:
+                    state = color.get(dep, WHITE)
+                    if state == BLACK:
+                        continue
+                    if state == GRAY:
+                        cycle = [n for n, _ in stack]
+                        cycle = cycle[cycle.index(dep):] + [dep]
+                        raise CircularDependencyError(
+                            f"Circular dependency detected involving modules: {' -> '.join(cycle)}"
+                        )
+                    if dep not in modules:
+                        raise MissingDependencyError(
+                            f"Module '{name}' depends on '{dep}' which is not available"
+                        )
+                    color[dep] = GRAY
+                    stack.append((dep, iter(modules[dep].manifest.depends)))
+                    break
+                else:
+                    # All dependencies emitted, emit the module itself
+                    stack.pop()
+                    color[name] = BLACK
+                    result.append(name)
+
         return result
 
     def get_dependency_chain(self, module_name: str) -> List[str]:
@@ -123,27 +275,19 @@ class ModuleGraph:
         if module_name not in self.modules:
             raise ValueError(f"Module '{module_name}' not found")
 
-        # Build subgraph with only relevant modules
-        visited = set()
-        to_visit = [module_name]
-
-        while to_visit:
-            current = to_visit.pop()
-            if current in visited:
-                continue
-            visited.add(current)
+        key = (self.version, module_name)
+        chain = self._chain_cache.get(key)
+        if chain is not None:
+            return list(chain)
 
-            if current in self.modules:
-                for dep in self.modules[current].manifest.depends:
-                    to_visit.append(dep)
+        chain = self.dependency_order([module_name])
 
-        # Create a subgraph and sort
-        subgraph = ModuleGraph()
-        for name in visited:
-            if name in self.modules:
-                subgraph.add_module(self.modules[name])
+        # Entries from older graph versions can never be hit again
+        if self._chain_cache and next(iter(self._chain_cache))[0] != self.version:
+            self._chain_cache.clear()
+        self._chain_cache[key] = chain
 
-        return subgraph.topological_sort()
+        return list(chain)
 
 
 class ModuleLoader:
@@ -165,6 +309,10 @@ class ModuleLoader:
         self.modules: Dict[str, Module] = {}
         self.graph = ModuleGraph()
         self._loaded_modules: Set[str] = set()
+        # (graph version, requested names) -> load order
+        self._load_order_cache: Dict[tuple, List[str]] = {}
+        # Addons directories this loader has put on sys.path
+        self._sys_paths: Set[str] = set()
 
     def add_addons_path(self, path: Path):
         """Add an addons directory to search"""
@@ -179,6 +327,7 @@ class ModuleLoader:
             Dictionary mapping module names to Module instances
         """
         discovered = {}
+        candidates: List[Path] = []
 
         for addons_path in self.addons_paths:
             if not addons_path.exists():
@@ -187,39 +336,54 @@ class ModuleLoader:
 
             logger.info(f"Discovering modules in: {addons_path}")
 
-            for item in addons_path.iterdir():
-                if not item.is_dir():
-                    continue
-
-                # Skip hidden directories and __pycache__
-                if item.name.startswith('.') or item.name == '__pycache__':
-                    continue
-
-                # Check for __manifest__.py
-                manifest_file = item / "__manifest__.py"
-                if not manifest_file.exists():
-                    continue
+            # DirEntry caches the file type, so is_dir() costs no extra stat
+            with os.scandir(addons_path) as entries:
+                for entry in entries:
+                    # Skip hidden directories and __pycache__
+                    if entry.name.startswith('.') or entry.name == '__pycache__':
+                        continue
 
-                try:
-                    module = Module.load_from_path(item)
+                    if not entry.is_dir():
+                        continue
 
-                    # Only add installable modules
-                    if not module.manifest.installable:
-                        logger.info(f"Skipping non-installable module: {module.name}")
+                    # Check for __manifest__.py
+                    if not os.path.isfile(os.path.join(entry.path, "__manifest__.py")):
                         continue
 
-                    discovered[module.name] = module
-                    logger.info(f"Discovered module: {module.name} v{module.manifest.version}")
+                    candidates.append(addons_path / entry.name)
+
+        # Reading and parsing manifests is I/O bound, overlap it in threads
+        max_workers = max(1, min(32, (os.cpu_count() or 1) * 4, len(candidates)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (item, executor.submit(Module.load_from_path, item))
+                for item in candidates
+            ]
 
+            # Collect in discovery order so later addons paths still win
+            for item, future in futures:
+                try:
+                    module = future.result()
                 except Exception as e:
                     logger.error(f"Failed to load module from {item}: {e}")
+                    continue
+
+                # Only add installable modules
+                if not module.manifest.installable:
+                    logger.info(f"Skipping non-installable module: {module.name}")
+                    continue
+
+                discovered[module.name] = module
+                logger.info(f"Discovered module: {module.name} v{module.manifest.version}")
 
         self.modules.update(discovered)
+        self._load_order_cache.clear()
         return discovered
 
     def build_dependency_graph(self):
         """Build the dependency graph from discovered modules"""
         self.graph = ModuleGraph()
+        self._load_order_cache.clear()
 
         for module in self.modules.values():
             self.graph.add_module(module)
@@ -240,23 +404,29 @@ class ModuleLoader:
             CircularDependencyError: If circular dependencies detected
             MissingDependencyError: If a dependency is missing
         """
+        # The order follows the order of the requested roots, so it is
+        # part of the key
+        key = (
+            self.graph.version,
+            None if module_names is None else tuple(module_names),
+        )
+        load_order = self._load_order_cache.get(key)
+        if load_order is not None:
+            return list(load_order)
+
         if module_names is None:
             # Load all modules
-            return self.graph.topological_sort()
+            load_order = self.graph.topological_sort()
         else:
             # Load only specified modules and their dependencies
-            all_modules = set()
-            for name in module_names:
-                chain = self.graph.get_dependency_chain(name)
-                all_modules.update(chain)
+            load_order = self.graph.dependency_order(module_names)
 
-            # Create subgraph
-            subgraph = ModuleGraph()
-            for name in all_modules:
-                if name in self.modules:
-                    subgraph.add_module(self.modules[name])
+        # Entries from older graph versions can never be hit again
+        if self._load_order_cache and next(iter(self._load_order_cache))[0] != key[0]:
+            self._load_order_cache.clear()
+        self._load_order_cache[key] = load_order
 
-            return subgraph.topological_sort()
+        return list(load_order)
 
     def load_module(self, module_name: str) -> Module:
         """
@@ -276,13 +446,20 @@ class ModuleLoader:
         if not module:
             raise ValueError(f"Module {module_name} not found")
 
+        # Already imported in this process (tests, reloads): skip importlib
+        if module_name in sys.modules:
+            self._loaded_modules.add(module_name)
+            module.state = ModuleState.INSTALLED
+            logger.debug(f"Module {module_name} already imported")
+            return module
+
         logger.info(f"Loading module: {module_name}")
 
         try:
             # Add the parent directory to sys.path if not already there
             parent_path = str(module.path.parent)
-            if parent_path not in sys.path:
-                sys.path.insert(0, parent_path)
+            if parent_path not in self._sys_paths:
+                self._add_sys_paths([parent_path])
 
             # Import the module package
             # This will execute __init__.py which should import models
@@ -300,6 +477,20 @@ class ModuleLoader:
             logger.error(f"Failed to load module {module_name}: {e}")
             raise
 
+    def _add_sys_paths(self, paths):
+        """
+        Prepend directories to sys.path, skipping those already present
+
+        Args:
+            paths: Directory paths, in the order they should be searched
+        """
+        current = set(sys.path)
+        for path in reversed(list(paths)):
+            if path not in current:
+                sys.path.insert(0, path)
+                current.add(path)
+            self._sys_paths.add(path)
+
     def load_modules(self, module_names: Optional[List[str]] = None):
         """
         Load modules in dependency order
@@ -312,6 +503,13 @@ class ModuleLoader:
 
         logger.info(f"Loading {len(load_order)} modules in order: {load_order}")
 
+        # Make every addons directory importable once, up front
+        self._add_sys_paths(dict.fromkeys(
+            str(self.modules[name].path.parent)
+            for name in load_order
+            if name in self.modules
+        ))
+
         # Load each module
         for module_name in load_order:
             self.load_module(module_name)
@@ -4,11 +4,38 @@ Module and Manifest Definitions
 Defines the structure of OpenFlow modules and their manifest files.
 """
 import ast
+import copy
+import hashlib
+import logging
+import os
+import pickle
+import struct
+import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
+# Parsed manifests can be pickled on disk, one file per manifest path, each
+# starting with the manifest mtime and size it was parsed from. The disk
+# cache is opt-in: it is off unless OPENFLOW_MANIFEST_CACHE_DIR is set.
+MANIFEST_CACHE_DIR: Optional[Path] = (
+    Path(os.environ['OPENFLOW_MANIFEST_CACHE_DIR'])
+    if os.environ.get('OPENFLOW_MANIFEST_CACHE_DIR') else None
+)
+_CACHE_HEADER = struct.Struct('<qq')
+_CACHE_SUFFIX = '.pkl'
+
+# Cache directories found unwritable, and those already pruned of entries
+# in other formats, by this process
+_unwritable_cache_dirs: set = set()
+_pruned_cache_dirs: set = set()
+
+# In-process cache with the same keys, so repeat discoveries skip the disk
+_manifest_cache: Dict[tuple, Dict[str, Any]] = {}
+
 
 class ModuleState(str, Enum):
     """Module installation states"""
@@ -19,7 +46,7 @@ class ModuleState(str, Enum):
     TO_REMOVE = "to remove"
 
 
-@dataclass
+@dataclass(slots=True)
 class ModuleManifest:
     """
     Module manifest structure following Odoo's __manifest__.py format
@@ -45,9 +72,10 @@ class ModuleManifest:
     description: str = ""
     author: str = "OpenFlow"
     website: str = ""
-    depends: List[str] = field(default_factory=list)
-    data: List[str] = field(default_factory=list)
-    demo: List[str] = field(default_factory=list)
+    # Read-only in the loader; empty tuples avoid a list per manifest
+    depends: Sequence[str] = ()
+    data: Sequence[str] = ()
+    demo: Sequence[str] = ()
     installable: bool = True
     auto_install: bool = False
     application: bool = False
@@ -57,9 +85,7 @@ class ModuleManifest:
     def from_dict(cls, data: Dict[str, Any]) -> 'ModuleManifest':
         """Create manifest from dictionary"""
         # Filter only known fields
-        valid_fields = {
-            f.name for f in cls.__dataclass_fields__.values()
-        }
+        valid_fields = cls._VALID_FIELDS
         filtered_data = {
             k: v for k, v in data.items() if k in valid_fields
         }
@@ -75,9 +101,9 @@ class ModuleManifest:
             'description': self.description,
             'author': self.author,
             'website': self.website,
-            'depends': self.depends,
-            'data': self.data,
-            'demo': self.demo,
+            'depends': list(self.depends),
+            'data': list(self.data),
+            'demo': list(self.demo),
             'installable': self.installable,
             'auto_install': self.auto_install,
             'application': self.application,
@@ -85,54 +111,73 @@ class ModuleManifest:
         }
 
 
-@dataclass
+# Field names accepted by ModuleManifest.from_dict
+ModuleManifest._VALID_FIELDS = frozenset(ModuleManifest.__dataclass_fields__)
+
+
+@dataclass(slots=True, eq=False)
 class Module:
     """Represents an OpenFlow module/addon"""
     name: str
     path: Path
     manifest: ModuleManifest
     state: ModuleState = ModuleState.UNINSTALLED
+    # Subdirectory names, filled on first access by _subdirs
+    _subdir_names: Optional[frozenset] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def module_path(self) -> Path:
         """Get the module directory path"""
         return self.path
 
+    @property
+    def _subdirs(self) -> frozenset:
+        """Names of the module's subdirectories, scanned once"""
+        names = self._subdir_names
+        if names is None:
+            try:
+                with os.scandir(self.path) as entries:
+                    names = frozenset(e.name for e in entries if e.is_dir())
+            except OSError:
+                names = frozenset()
+            self._subdir_names = names
+        return names
+
+    def _subdir(self, name: str) -> Optional[Path]:
+        """Get a subdirectory of the module if it exists"""
+        return self.path / name if name in self._subdirs else None
+
     @property
     def models_path(self) -> Optional[Path]:
         """Get the models directory if it exists"""
-        models_dir = self.path / "models"
-        return models_dir if models_dir.exists() else None
+        return self._subdir("models")
 
     @property
     def views_path(self) -> Optional[Path]:
         """Get the views directory if it exists"""
-        views_dir = self.path / "views"
-        return views_dir if views_dir.exists() else None
+        return self._subdir("views")
 
     @property
     def security_path(self) -> Optional[Path]:
         """Get the security directory if it exists"""
-        security_dir = self.path / "security"
-        return security_dir if security_dir.exists() else None
+        return self._subdir("security")
 
     @property
     def data_path(self) -> Optional[Path]:
         """Get the data directory if it exists"""
-        data_dir = self.path / "data"
-        return data_dir if data_dir.exists() else None
+        return self._subdir("data")
 
     @property
     def controllers_path(self) -> Optional[Path]:
         """Get the controllers directory if it exists"""
-        controllers_dir = self.path / "controllers"
-        return controllers_dir if controllers_dir.exists() else None
+        return self._subdir("controllers")
 
     @property
     def static_path(self) -> Optional[Path]:
         """Get the static directory if it exists"""
-        static_dir = self.path / "static"
-        return static_dir if static_dir.exists() else None
+        return self._subdir("static")
 
     @classmethod
     def load_from_path(cls, module_path: Path) -> 'Module':
@@ -174,8 +219,33 @@ class Module:
             manifest=manifest,
         )
 
+    @classmethod
+    def _parse_manifest(cls, manifest_file: Path) -> Dict[str, Any]:
+        """
+        Parse __manifest__.py file, using the manifest caches
+
+        Args:
+            manifest_file: Path to __manifest__.py
+
+        Returns:
+            Dictionary with manifest data
+        """
+        stat = manifest_file.stat()
+        key = (str(manifest_file.resolve()), stat.st_mtime_ns, stat.st_size)
+
+        manifest = _manifest_cache.get(key)
+        if manifest is None:
+            manifest = _read_manifest_cache(key)
+            if manifest is None:
+                manifest = cls._parse_manifest_source(manifest_file)
+                _write_manifest_cache(key, manifest)
+            _manifest_cache[key] = manifest
+
+        # Callers own the returned dict and its lists
+        return copy.deepcopy(manifest)
+
     @staticmethod
-    def _parse_manifest(manifest_file: Path) -> Dict[str, Any]:
+    def _parse_manifest_source(manifest_file: Path) -> Dict[str, Any]:
         """
         Parse __manifest__.py file safely
 
@@ -185,14 +255,22 @@ class Module:
         Returns:
             Dictionary with manifest data
         """
-        with open(manifest_file, 'r', encoding='utf-8') as f:
+        # utf-8-sig strips a leading BOM, which literal_eval rejects
+        with open(manifest_file, 'r', encoding='utf-8-sig') as f:
             content = f.read()
 
-        # Parse the Python file safely
+        # Fast path: the whole file is a single dict literal
+        try:
+            manifest = ast.literal_eval(content)
+            if isinstance(manifest, dict):
+                return manifest
+        except (SyntaxError, ValueError):
+            pass
+
+        # Legacy manifests assign the dict or wrap it in other statements
         try:
             tree = ast.parse(content)
 
-            # Find the dictionary assignment (usually the entire file is a dict)
             for node in ast.walk(tree):
                 if isinstance(node, ast.Expr) and isinstance(node.value, ast.Dict):
                     return ast.literal_eval(node.value)
@@ -200,8 +278,7 @@ class Module:
                     if isinstance(node.value, ast.Dict):
                         return ast.literal_eval(node.value)
 
-            # If no dict found, try to evaluate the entire content
-            return ast.literal_eval(content)
+            raise ValueError("no manifest dictionary found")
         except (SyntaxError, ValueError) as e:
             raise ValueError(
                 f"Invalid manifest file {manifest_file}: {e}"
@@ -217,3 +294,96 @@ class Module:
         if isinstance(other, Module):
             return self.name == other.name
         return False
+
+
+def _manifest_cache_dir() -> Optional[Path]:
+    """Get the usable disk cache directory, None when the cache is off"""
+    cache_dir = MANIFEST_CACHE_DIR
+    if cache_dir is None or cache_dir in _unwritable_cache_dirs:
+        return None
+    return cache_dir
+
+
+def _manifest_cache_file(cache_dir: Path, key: tuple) -> Path:
+    """Get the on-disk cache file for a manifest path"""
+    digest = hashlib.sha1(key[0].encode('utf-8')).hexdigest()
+    return cache_dir / f"{digest}{_CACHE_SUFFIX}"
+
+
+def _prune_manifest_cache(cache_dir: Path):
+    """Remove entries left in the cache directory by other cache formats"""
+    _pruned_cache_dirs.add(cache_dir)
+    try:
+        for entry in cache_dir.iterdir():
+            # .tmp files are writes in flight, possibly from other processes
+            if entry.suffix not in (_CACHE_SUFFIX, '.tmp') and entry.is_file():
+                entry.unlink(missing_ok=True)
+    except OSError as e:
+        logger.debug(f"Could not prune manifest cache {cache_dir}: {e}")
+
+
+def _manifest_cache_header(key: tuple) -> bytes:
+    """Pack the manifest mtime and size that a cache file must match"""
+    return _CACHE_HEADER.pack(key[1], key[2])
+
+
+def _read_manifest_cache(key: tuple) -> Optional[Dict[str, Any]]:
+    """Read a parsed manifest from the disk cache, None on miss"""
+    cache_dir = _manifest_cache_dir()
+    if cache_dir is None:
+        return None
+
+    try:
+        with open(_manifest_cache_file(cache_dir, key), 'rb') as f:
+            content = f.read()
+    except OSError:
+        return None
+
+    # Stale entries are rejected before anything is unpickled
+    header = _manifest_cache_header(key)
+    if not content.startswith(header):
+        return None
+
+    # A truncated or foreign file can fail to unpickle in many ways; any
+    # failure is just a miss, so the manifest is parsed from source
+    try:
+        manifest = pickle.loads(content[len(header):])
+    except Exception:
+        return None
+    return manifest if isinstance(manifest, dict) else None
+
+
+def _write_manifest_cache(key: tuple, manifest: Dict[str, Any]):
+    """
+    Write a parsed manifest to the disk cache
+
+    The file is written atomically. An unwritable directory turns the
+    disk cache off for the rest of the process; other failures
+    (unpicklable values) only cost the cache entry.
+    """
+    cache_dir = _manifest_cache_dir()
+    if cache_dir is None:
+        return
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    except OSError as e:
+        _unwritable_cache_dirs.add(cache_dir)
+        logger.debug(f"Manifest cache disabled, {cache_dir} is not writable: {e}")
+        return
+
+    if cache_dir not in _pruned_cache_dirs:
+        _prune_manifest_cache(cache_dir)
+
+    try:
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_manifest_cache_header(key))
+                pickle.dump(manifest, f, protocol=5)
+            os.replace(tmp_path, _manifest_cache_file(cache_dir, key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, pickle.PicklingError, TypeError, ValueError) as e:
+        logger.debug(f"Could not cache manifest {key[0]}: {e}")
@@ -4,12 +4,14 @@ Module Registry
 Manages module state persistence and integration with the ORM.
 """
 import logging
+import threading
+from collections import defaultdict
 from typing import Dict, List, Optional, Set
 from pathlib import Path
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .module import Module, ModuleState
-from .loader import ModuleLoader
+from .loader import ModuleLoader, CircularDependencyError, MissingDependencyError
 
 logger = logging.getLogger(__name__)
 
@@ -25,21 +27,26 @@ class ModuleRegistry:
     """
 
     _instance = None
-    _initialized = False
+    _lock = threading.Lock()
 
     def __new__(cls):
-        """Singleton pattern"""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-
-    def __init__(self):
-        """Initialize the registry"""
-        if not self._initialized:
-            self.loader: Optional[ModuleLoader] = None
-            self.modules: Dict[str, Module] = {}
-            self._module_states: Dict[str, ModuleState] = {}
-            ModuleRegistry._initialized = True
+        """Singleton pattern, created once under a lock"""
+        instance = cls._instance
+        if instance is None:
+            with cls._lock:
+                instance = cls._instance
+                if instance is None:
+                    instance = super().__new__(cls)
+                    instance.loader: Optional[ModuleLoader] = None
+                    instance.modules: Dict[str, Module] = {}
+                    instance._module_states: Dict[str, ModuleState] = {}
+                    # Module name -> names of modules depending on it
+                    instance._reverse_deps: Dict[str, Set[str]] = {}
+                    # Load order of every module, keyed by the graph it came from
+                    instance._global_order: Optional[List[str]] = None
+                    instance._global_order_key: Optional[tuple] = None
+                    cls._instance = instance
+        return instance
 
     def initialize(self, addons_paths: List[Path]):
         """
@@ -57,6 +64,7 @@ class ModuleRegistry:
 
         # Build dependency graph
         self.loader.build_dependency_graph()
+        self._build_reverse_deps()
 
         logger.info(f"Module registry initialized with {len(self.modules)} modules")
 
@@ -88,7 +96,41 @@ class ModuleRegistry:
         if not self.loader:
             raise RuntimeError("Module registry not initialized")
 
-        return self.loader.get_load_order(module_names)
+        if module_names is None:
+            return self.loader.get_load_order()
+
+        global_order = self._get_global_order()
+        if global_order is None:
+            # Some module outside the request may be broken, sort the subset
+            return self.loader.get_load_order(module_names)
+
+        # Filter the full order down to the requested modules' dependencies
+        graph = self.loader.graph
+        required: Set[str] = set()
+        for name in module_names:
+            required.update(graph.get_dependency_chain(name))
+
+        return [name for name in global_order if name in required]
+
+    def _get_global_order(self) -> Optional[List[str]]:
+        """
+        Get the load order of all modules, sorted once per graph version
+
+        Returns:
+            List of all module names in load order, or None if the full
+            graph has missing or circular dependencies
+        """
+        graph = self.loader.graph
+        key = (graph, graph.version)
+
+        if self._global_order_key != key:
+            try:
+                self._global_order = graph.topological_sort()
+            except (CircularDependencyError, MissingDependencyError):
+                self._global_order = None
+            self._global_order_key = key
+
+        return self._global_order
 
     def load_modules(self, module_names: Optional[List[str]] = None):
         """
@@ -104,6 +146,15 @@ class ModuleRegistry:
 
         # Update local cache
         self.modules = self.loader.modules
+        self._build_reverse_deps()
+
+    def _build_reverse_deps(self):
+        """Index the modules depending on each module"""
+        reverse_deps: Dict[str, Set[str]] = defaultdict(set)
+        for name, module in self.modules.items():
+            for dep in module.manifest.depends:
+                reverse_deps[dep].add(name)
+        self._reverse_deps = dict(reverse_deps)
 
     async def sync_module_states(self, session: AsyncSession):
         """
@@ -139,7 +190,7 @@ class ModuleRegistry:
 
         # Get modules to install
         if with_dependencies:
-            to_install = self.loader.get_load_order([module_name])
+            to_install = self.get_load_order([module_name])
         else:
             to_install = [module_name]
 
@@ -221,12 +272,11 @@ class ModuleRegistry:
         Returns:
             List of dependent module names
         """
-        dependent = []
-        for name, module in self.modules.items():
-            if module.state == ModuleState.INSTALLED:
-                if module_name in module.manifest.depends:
-                    dependent.append(name)
-        return dependent
+        modules = self.modules
+        return sorted(
+            name for name in self._reverse_deps.get(module_name, ())
+            if name in modules and modules[name].state == ModuleState.INSTALLED
+        )
 
     def get_module_info(self, module_name: str) -> Dict:
         """
@@ -28,6 +28,7 @@ Example usage:
     partner = env['res.partner'].search([('name', '=', 'John')])[0]
     partner.write({'email': 'john@example.com'})
 """
+import importlib
 
 # Field types
 from .fields import (
@@ -47,10 +48,6 @@ from .fields import (
     FIELD_TYPES,
 )
 
-# Model and RecordSet
-from .models import Model, ModelMetaclass
-from .recordset import RecordSet
-
 # Registry and Environment
 from .registry import ModelRegistry, Environment, registry, get_env
 
@@ -63,9 +60,30 @@ from .domain import (
     DomainParser,
     DomainNode,
     normalize_domain,
+    domain_shape,
     domain_to_sql,
 )
 
+# Model and RecordSet are imported on first access (PEP 562): models pulls
+# in SQLAlchemy, which tools that only discover modules do not need.
+# Names that clash with a submodule (fields, registry) must stay eager.
+_LAZY = {
+    'Model': '.models',
+    'ModelMetaclass': '.models',
+    'RecordSet': '.recordset',
+    'read_batch': '.models',
+}
+
+
+def __getattr__(name):
+    """Import lazily exported names on first access"""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 # Convenience namespace for fields
 class fields:
@@ -105,6 +123,7 @@ __all__ = [
     'Model',
     'ModelMetaclass',
     'RecordSet',
+    'read_batch',
     # Registry
     'ModelRegistry',
     'Environment',
@@ -118,5 +137,6 @@ __all__ = [
     'DomainParser',
     'DomainNode',
     'normalize_domain',
+    'domain_shape',
     'domain_to_sql',
 ]
@@ -7,9 +7,13 @@ Examples:
     ['&', ('age', '>', 18), ('active', '=', True)]
     ['|', ('state', '=', 'draft'), ('state', '=', 'open')]
 """
-from typing import List, Tuple, Any, Union, Optional
+import functools
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from enum import Enum
 
+from .registry import registry
+
 
 class DomainOperator(str, Enum):
     """Domain operators for comparisons"""
@@ -34,11 +38,34 @@ class LogicalOperator(str, Enum):
     NOT = '!'
 
 
+_LOGICAL_OPERATORS = frozenset(('&', '|', '!'))
+
+
 # Type alias for domain expressions
 DomainLeaf = Tuple[str, str, Any]
 Domain = List[Union[str, DomainLeaf]]
 
 
+def _item_kind(item: Any) -> Optional[type]:
+    """
+    Classify a domain item whose type is not exactly str, tuple or list
+
+    Hot loops compare type() by identity and only call this for
+    subclasses such as str enums or named tuples.
+
+    Args:
+        item: Domain element
+
+    Returns:
+        str for operators, tuple for leaves, None for anything else
+    """
+    if isinstance(item, str):
+        return str
+    if isinstance(item, (tuple, list)):
+        return tuple
+    return None
+
+
 class DomainParser:
     """
     Parser for domain expressions
@@ -73,18 +100,19 @@ class DomainParser:
         if not self.domain:
             return []
 
-        # Count logical operators vs conditions
-        op_count = sum(1 for item in self.domain if isinstance(item, str) and item in ['&', '|', '!'])
-        leaf_count = sum(1 for item in self.domain if isinstance(item, tuple))
-
-        # If no operators, add implicit ANDs
+        # Count logical operators vs conditions in a single pass
+        op_count = leaf_count = 0
+        for item in self.domain:
+            item_type = type(item)
+            if item_type is str:
+                if item in _LOGICAL_OPERATORS:
+                    op_count += 1
+            elif item_type is tuple or item_type is list:
+                leaf_count += 1
+
+        # If no operators, add implicit ANDs between all conditions
         if op_count == 0 and leaf_count > 1:
-            # Add AND operators between all conditions
-            result = []
-            for i in range(leaf_count - 1):
-                result.append('&')
-            result.extend(self.domain)
-            return result
+            return ['&'] * (leaf_count - 1) + list(self.domain)
 
         return self.domain
 
@@ -101,39 +129,52 @@ class DomainParser:
 
         self.domain = normalized
         self.position = 0
-        return self._parse_expression()
-
-    def _parse_expression(self) -> 'DomainNode':
-        """Parse a single domain expression"""
-        if self.position >= len(self.domain):
-            raise ValueError("Unexpected end of domain")
-
-        current = self.domain[self.position]
-        self.position += 1
-
-        # Logical operators
-        if isinstance(current, str):
-            if current == '!':
-                # NOT operator - requires 1 operand
-                operand = self._parse_expression()
-                return DomainNode('!', [operand])
-            elif current in ['&', '|']:
-                # AND/OR operators - require 2 operands
-                left = self._parse_expression()
-                right = self._parse_expression()
-                return DomainNode(current, [left, right])
-            else:
-                raise ValueError(f"Unknown operator: {current}")
 
-        # Leaf condition
-        elif isinstance(current, (tuple, list)):
+        # Iterative prefix parser: each pending operator is kept as
+        # [operator, operands still needed, children] on an explicit stack
+        pending = []
+
+        for current in normalized:
+            self.position += 1
+
+            kind = type(current)
+            if kind is not str and kind is not tuple and kind is not list:
+                kind = _item_kind(current)
+
+            # Logical operators
+            if kind is str:
+                if current == '!':
+                    # NOT operator - requires 1 operand
+                    pending.append(['!', 1, []])
+                elif current in ('&', '|'):
+                    # AND/OR operators - require 2 operands
+                    pending.append([current, 2, []])
+                else:
+                    raise ValueError(f"Unknown operator: {current}")
+                continue
+
+            # Leaf condition
+            if kind is None:
+                raise ValueError(f"Invalid domain element: {current}")
             if len(current) != 3:
                 raise ValueError(f"Invalid domain leaf: {current}")
             field, operator, value = current
-            return DomainNode('leaf', [], field=field, operator=operator, value=value)
+            node = DomainNode('leaf', [], field=field, comparison_op=operator, value=value)
+
+            # Hand the node to its operator, closing every operator it completes
+            while pending:
+                frame = pending[-1]
+                frame[2].append(node)
+                frame[1] -= 1
+                if frame[1]:
+                    break
+                pending.pop()
+                node = DomainNode(frame[0], frame[2])
+            else:
+                # The root expression is complete
+                return node
 
-        else:
-            raise ValueError(f"Invalid domain element: {current}")
+        raise ValueError("Unexpected end of domain")
 
     def to_sql(self, model_class, alias: str = 'main') -> Tuple[str, List[Any]]:
         """
@@ -149,10 +190,131 @@ class DomainParser:
         if not self.domain:
             return ('TRUE', [])
 
-        ast = self.parse()
+        ast = self.parse().simplify()
         return ast.to_sql(model_class, alias)
 
 
+@functools.lru_cache(maxsize=1024)
+def _column(alias: str, field_name: str) -> str:
+    """Qualified column name for a field, interned"""
+    return sys.intern(f"{alias}.{field_name}")
+
+
+@functools.lru_cache(maxsize=4096)
+def _comparison(column: str, sql_operator: str) -> str:
+    """Interned 'column <op> %s' fragment"""
+    return sys.intern(f"{column} {sql_operator} %s")
+
+
+# Placeholder lists for 'in' arities up to this size are kept
+_PLACEHOLDERS_CACHE_MAX = 256
+_placeholders_cache: Dict[int, str] = {}
+
+
+def _placeholders(count: int) -> str:
+    """Comma-separated %s placeholders, built once per arity"""
+    placeholders = _placeholders_cache.get(count)
+    if placeholders is None:
+        placeholders = ', '.join(['%s'] * count)
+        if count <= _PLACEHOLDERS_CACHE_MAX:
+            _placeholders_cache[count] = placeholders
+    return placeholders
+
+
+def _eq(column: str, value: Any) -> Tuple[str, List[Any]]:
+    if value is None or value is False:
+        return (f"{column} IS NULL", [])
+    return (_comparison(column, '='), [value])
+
+
+def _ne(column: str, value: Any) -> Tuple[str, List[Any]]:
+    if value is None or value is False:
+        return (f"{column} IS NOT NULL", [])
+    return (_comparison(column, '!='), [value])
+
+
+def _in(column: str, value: Any) -> Tuple[str, List[Any]]:
+    if not value:
+        return ('FALSE', [])
+    # Always a copy, so the params never alias the caller's domain
+    params = list(value)
+    return (f"{column} IN ({_placeholders(len(params))})", params)
+
+
+def _not_in(column: str, value: Any) -> Tuple[str, List[Any]]:
+    if not value:
+        return ('TRUE', [])
+    params = list(value)
+    return (f"{column} NOT IN ({_placeholders(len(params))})", params)
+
+
+def _binary(sql_operator: str):
+    """Handler for a plain 'column <op> %s' comparison"""
+    def handler(column: str, value: Any) -> Tuple[str, List[Any]]:
+        return (_comparison(column, sql_operator), [value])
+    return handler
+
+
+# 'in' / 'not in' lists longer than this are costed as expensive
+_SMALL_IN_SIZE = 10
+
+# Relative evaluation cost of a leaf, by comparison operator
+_OPERATOR_COSTS = {
+    '=': 2, '!=': 2, '>': 2, '<': 2, '>=': 2, '<=': 2,
+    'in': 3, 'not in': 3,
+    'like': 4,
+    'ilike': 5,
+}
+
+
+def _conjunct_cost(node: 'DomainNode', model_class) -> int:
+    """
+    Estimate how cheap and selective an AND operand is, lowest first
+
+    Args:
+        node: Operand of an AND node
+        model_class: Model class for field lookups
+
+    Returns:
+        0 for id equality, 1 for equality on an indexed field, 2 for other
+        comparisons, 3 for short 'in' lists, 4 for like, 5 for ilike,
+        6 for long 'in' lists and 9 for nested OR/NOT subtrees
+    """
+    if node.operator != 'leaf':
+        return 9
+
+    operator = node.comparison_op
+    if operator == '=' and node.value is not None and node.value is not False:
+        if node.field == 'id':
+            return 0
+        field = getattr(model_class, '_fields', {}).get(node.field)
+        if getattr(field, 'index', False) is True:
+            return 1
+    elif operator in ('in', 'not in'):
+        try:
+            if len(node.value) > _SMALL_IN_SIZE:
+                return 6
+        except TypeError:
+            pass
+
+    return _OPERATOR_COSTS.get(operator, 9)
+
+
+# Domain comparison operator -> leaf SQL builder
+_OP_HANDLERS: Dict[str, Callable[[str, Any], Tuple[str, List[Any]]]] = {
+    '=': _eq,
+    '!=': _ne,
+    '>': _binary('>'),
+    '<': _binary('<'),
+    '>=': _binary('>='),
+    '<=': _binary('<='),
+    'like': _binary('LIKE'),
+    'ilike': _binary('ILIKE'),
+    'in': _in,
+    'not in': _not_in,
+}
+
+
 class DomainNode:
     """
     Node in domain AST
@@ -162,6 +324,8 @@ class DomainNode:
     - A leaf condition (field, operator, value)
     """
 
+    __slots__ = ('operator', 'children', 'field', 'comparison_op', 'value')
+
     def __init__(
         self,
         operator: str,
@@ -214,91 +378,81 @@ class DomainNode:
         operator = self.comparison_op
         value = self.value
 
-        # Get field from model
-        if not hasattr(model_class, field_name):
+        # Models index their fields (including 'id') in _fields; fall back
+        # to attribute lookup for plain classes
+        model_fields = getattr(model_class, '_fields', None)
+        if model_fields is not None:
+            if field_name not in model_fields:
+                raise ValueError(f"Field '{field_name}' not found on model '{model_class._name}'")
+        elif not hasattr(model_class, field_name):
             raise ValueError(f"Field '{field_name}' not found on model '{model_class._name}'")
 
-        # Handle special case for id field
-        if field_name == 'id':
-            column = f"{alias}.id"
-        else:
-            column = f"{alias}.{field_name}"
-
-        # Convert operator to SQL
-        if operator == '=':
-            if value is None or value is False:
-                return (f"{column} IS NULL", [])
-            return (f"{column} = %s", [value])
-
-        elif operator == '!=':
-            if value is None or value is False:
-                return (f"{column} IS NOT NULL", [])
-            return (f"{column} != %s", [value])
-
-        elif operator == '>':
-            return (f"{column} > %s", [value])
-
-        elif operator == '<':
-            return (f"{column} < %s", [value])
-
-        elif operator == '>=':
-            return (f"{column} >= %s", [value])
-
-        elif operator == '<=':
-            return (f"{column} <= %s", [value])
-
-        elif operator == 'like':
-            return (f"{column} LIKE %s", [value])
-
-        elif operator == 'ilike':
-            return (f"{column} ILIKE %s", [value])
-
-        elif operator == 'in':
-            if not value:
-                return ('FALSE', [])
-            placeholders = ', '.join(['%s'] * len(value))
-            return (f"{column} IN ({placeholders})", list(value))
-
-        elif operator == 'not in':
-            if not value:
-                return ('TRUE', [])
-            placeholders = ', '.join(['%s'] * len(value))
-            return (f"{column} NOT IN ({placeholders})", list(value))
-
-        elif operator in ['child_of', 'parent_of']:
-            # These require hierarchical query support
-            raise NotImplementedError(f"Operator '{operator}' not yet implemented")
-
-        else:
+        handler = _OP_HANDLERS.get(operator)
+        if handler is None:
+            if operator in ('child_of', 'parent_of'):
+                # These require hierarchical query support
+                raise NotImplementedError(f"Operator '{operator}' not yet implemented")
             raise ValueError(f"Unknown operator: {operator}")
 
+        return handler(_column(alias, field_name), value)
+
     def _and_to_sql(self, model_class, alias: str) -> Tuple[str, List[Any]]:
         """Convert AND node to SQL"""
         if not self.children:
             return ('TRUE', [])
-
-        parts = []
-        params = []
-        for child in self.children:
-            sql, child_params = child.to_sql(model_class, alias)
-            parts.append(f"({sql})")
-            params.extend(child_params)
-
-        return (' AND '.join(parts), params)
+        return self._join_children(' AND ', model_class, alias)
 
     def _or_to_sql(self, model_class, alias: str) -> Tuple[str, List[Any]]:
         """Convert OR node to SQL"""
         if not self.children:
             return ('FALSE', [])
+        return self._join_children(' OR ', model_class, alias)
 
+    def _operands(self) -> List['DomainNode']:
+        """
+        Get the operands of an AND/OR node as one flat list
+
+        Polish notation nests chains of the same operator ('&', '&', a, b, c
+        parses as AND(AND(a, b), c)); since AND and OR are associative,
+        same-operator descendants are spliced in so the chain is emitted as
+        a single n-ary join.
+        """
+        operator = self.operator
+        operands = []
+        stack = [iter(self.children)]
+
+        while stack:
+            for child in stack[-1]:
+                if child.operator == operator and child.children:
+                    stack.append(iter(child.children))
+                    break
+                operands.append(child)
+            else:
+                stack.pop()
+
+        return operands
+
+    def _join_children(self, separator: str, model_class, alias: str) -> Tuple[str, List[Any]]:
+        """Join the parenthesized SQL of all operands with a separator"""
+        children = self._operands()
+        if self.operator == '&':
+            # Cheap, selective conjuncts first so row filters can stop early
+            children.sort(key=lambda child: _conjunct_cost(child, model_class))
         parts = []
         params = []
-        for child in self.children:
+
+        for child in children:
             sql, child_params = child.to_sql(model_class, alias)
-            parts.append(f"({sql})")
-            params.extend(child_params)
+            parts.append(sql)
+            # Most leaves bind zero or one parameter
+            count = len(child_params)
+            if count == 1:
+                params.append(child_params[0])
+            elif count:
+                params += child_params
 
-        return (' OR '.join(parts), params)
+        sql = f"({f'){separator}('.join(parts)})"
+        return (sql, params)
 
     def _not_to_sql(self, model_class, alias: str) -> Tuple[str, List[Any]]:
         """Convert NOT node to SQL"""
@@ -308,6 +462,54 @@ class DomainNode:
         sql, params = self.children[0].to_sql(model_class, alias)
         return (f"NOT ({sql})", params)
 
+    def simplify(self) -> 'DomainNode':
+        """
+        Fold constant subtrees and push NOT down to the leaves
+
+        Empty 'in' leaves are always false and empty 'not in' leaves always
+        true; AND/OR nodes drop neutral operands and short-circuit on an
+        absorbing one, so the emitted SQL only contains live conditions.
+        NOT is moved inward with De Morgan's laws and absorbed into leaf
+        operators where an inverse exists, so the database planner sees
+        plain column predicates.
+
+        Returns:
+            Equivalent node, possibly _TRUE or _FALSE
+        """
+        operator = self.operator
+
+        if operator == 'leaf':
+            if not self.value:
+                if self.comparison_op == 'in':
+                    return _FALSE
+                if self.comparison_op == 'not in':
+                    return _TRUE
+            return self
+
+        if operator == '!':
+            if not self.children:
+                return self
+            return _negate(self.children[0].simplify())
+
+        if operator in ('&', '|') and self.children:
+            # TRUE is neutral for AND and absorbing for OR, FALSE the reverse
+            neutral, absorbing = (_TRUE, _FALSE) if operator == '&' else (_FALSE, _TRUE)
+            operands = []
+            for child in self._operands():
+                child = child.simplify()
+                if child is absorbing:
+                    return absorbing
+                if child is not neutral:
+                    operands.append(child)
+
+            if not operands:
+                return neutral
+            if len(operands) == 1:
+                return operands[0]
+            return DomainNode(operator, operands)
+
+        return self
+
     def __repr__(self) -> str:
         """String representation of node"""
         if self.operator == 'leaf':
@@ -316,6 +518,53 @@ class DomainNode:
             return f"{self.operator}({', '.join(map(str, self.children))})"
 
 
+# Constant nodes produced by simplify(): an empty AND is TRUE, an empty OR FALSE
+_TRUE = DomainNode('&', [])
+_FALSE = DomainNode('|', [])
+
+# Leaf operators and their negations; comparisons with NULL stay NULL
+# either way, so e.g. NOT (a > x) and a <= x select the same rows
+_NEGATED_OPERATORS = {
+    '=': '!=', '!=': '=',
+    '>': '<=', '<=': '>',
+    '<': '>=', '>=': '<',
+    'in': 'not in', 'not in': 'in',
+}
+
+
+def _negate(node: DomainNode) -> DomainNode:
+    """
+    Negate an already simplified node, pushing the NOT inward
+
+    Args:
+        node: Simplified node to negate
+
+    Returns:
+        Simplified node equivalent to NOT node
+    """
+    if node is _TRUE:
+        return _FALSE
+    if node is _FALSE:
+        return _TRUE
+
+    operator = node.operator
+    if operator == 'leaf':
+        negated = _NEGATED_OPERATORS.get(node.comparison_op)
+        if negated is None:
+            # like/ilike and friends have no inverse operator
+            return DomainNode('!', [node])
+        return DomainNode('leaf', [], node.field, negated, node.value)
+
+    if operator == '!' and node.children:
+        return node.children[0]
+
+    if operator in ('&', '|') and node.children:
+        flipped = '|' if operator == '&' else '&'
+        return DomainNode(flipped, [_negate(child) for child in node.children])
+
+    return DomainNode('!', [node])
+
+
 def normalize_domain(domain: Domain) -> Domain:
     """
     Normalize domain expression
@@ -330,10 +579,66 @@ def normalize_domain(domain: Domain) -> Domain:
     return parser.normalize()
 
 
+def domain_shape(domain: Domain) -> Tuple[Tuple[Any, ...], List[Any]]:
+    """
+    Split a domain into a hashable shape and its parameters
+
+    The shape keeps everything the generated SQL depends on (operators,
+    field names, NULL comparisons and the length of 'in' lists) and drops
+    the literals, which are returned in placeholder order. Domains with
+    the same shape translate to the same SQL.
+
+    Args:
+        domain: Domain expression
+
+    Returns:
+        Tuple of (shape, parameters)
+
+    Raises:
+        ValueError: If the domain contains a malformed element
+    """
+    shape = []
+    params = []
+
+    for item in domain:
+        kind = type(item)
+        if kind is not str and kind is not tuple and kind is not list:
+            kind = _item_kind(item)
+
+        if kind is str:
+            shape.append(item)
+            continue
+
+        if kind is None:
+            raise ValueError(f"Invalid domain element: {item}")
+        if len(item) != 3:
+            raise ValueError(f"Invalid domain leaf: {item}")
+
+        field, operator, value = item
+        if operator in ('=', '!=') and (value is None or value is False):
+            shape.append((field, operator, None))
+        elif operator in ('in', 'not in'):
+            if not value:
+                shape.append((field, operator, 0))
+                continue
+            if type(value) is not list and type(value) is not tuple:
+                value = list(value)
+            shape.append((field, operator, len(value)))
+            params.extend(value)
+        else:
+            shape.append((field, operator, ...))
+            params.append(value)
+
+    return tuple(shape), params
+
+
 def domain_to_sql(domain: Domain, model_class, alias: str = 'main') -> Tuple[str, List[Any]]:
     """
     Convert domain to SQL WHERE clause
 
+    The SQL is compiled once per domain shape and model; later calls with
+    the same shape only collect the parameters.
+
     Args:
         domain: Domain expression
         model_class: Model class for field lookups
@@ -342,5 +647,87 @@ def domain_to_sql(domain: Domain, model_class, alias: str = 'main') -> Tuple[str
     Returns:
         Tuple of (sql_string, parameters)
     """
-    parser = DomainParser(domain)
-    return parser.to_sql(model_class, alias)
+    if not domain:
+        return ('TRUE', [])
+
+    shape, params = domain_shape(domain)
+    try:
+        sql, bind = _compile_shape(shape, model_class, alias, registry.version)
+    except TypeError:
+        # Unhashable field names or operators, compile without the cache
+        return DomainParser(domain).to_sql(model_class, alias)
+
+    # Simplification and conjunct ordering may drop or reorder parameters
+    if bind is not None:
+        params = bind(params)
+    return sql, params
+
+
+def _make_binder(param_indices: List[int]) -> Callable[[List[Any]], List[Any]]:
+    """
+    Generate a function picking parameters by position
+
+    The indices are baked into the function body, so binding a cached
+    shape is a single list display with no loop or index lookups.
+
+    Args:
+        param_indices: Positions of the parameters to keep, in order
+
+    Returns:
+        Function mapping the domain_shape() parameters to the SQL ones
+    """
+    items = ', '.join(f"p[{int(i)}]" for i in param_indices)
+    namespace: Dict[str, Any] = {}
+    exec(compile(f"def bind(p):\n    return [{items}]\n", '<domain>', 'exec'), namespace)
+    return namespace['bind']
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_shape(
+    shape: Tuple[Any, ...],
+    model_class,
+    alias: str,
+    version: int
+) -> Tuple[str, Optional[Callable[[List[Any]], List[Any]]]]:
+    """
+    Compile a domain shape to its SQL template
+
+    The registry version is part of the cache key so entries compiled
+    against replaced model classes are not reused.
+
+    Args:
+        shape: Domain shape from domain_shape()
+        model_class: Model class for field lookups
+        alias: Table alias
+        version: Model registry version
+
+    Returns:
+        Tuple of (SQL string with %s placeholders, function selecting the
+        domain_shape() parameters that the placeholders take, or None
+        when they take all of them in order)
+    """
+    # Rebuild the domain with each value replaced by its parameter index;
+    # SQL only depends on the shape, and the emitted params tell which
+    # parameters survived simplification
+    domain = []
+    position = 0
+    for item in shape:
+        if isinstance(item, str):
+            domain.append(item)
+            continue
+        field, operator, marker = item
+        if marker is None:
+            domain.append((field, operator, None))
+        elif marker is ...:
+            domain.append((field, operator, position))
+            position += 1
+        else:
+            domain.append((field, operator, list(range(position, position + marker))))
+            position += marker
+
+    sql, param_indices = DomainParser(domain).to_sql(model_class, alias)
+    # Interned so templates shared across callers compare by identity
+    sql = sys.intern(sql)
+    if param_indices == list(range(position)):
+        return sql, None
+    return sql, _make_binder(param_indices)
@@ -9,6 +9,13 @@ from datetime import date, datetime
 from enum import Enum
 
 
+# Sentinel for cache misses, distinct from a cached None
+_MISSING = object()
+
+# Fallback formats for DateTime values that are not ISO 8601
+_DATETIME_FORMATS = ('%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S.%f')
+
+
 class Field:
     """
     Base field descriptor for model attributes
@@ -30,6 +37,12 @@ class Field:
         groups: Comma-separated list of group external IDs that can access this field
     """
 
+    __slots__ = (
+        'string', 'required', 'readonly', '_default', 'compute', 'inverse',
+        'search', 'related', 'store', 'depends', 'index', 'copy', 'help',
+        'groups', 'name', 'model_name',
+    )
+
     _field_type = 'field'
     _column_type = None  # Will be set by subclasses
 
@@ -67,7 +80,6 @@ class Field:
         self.groups = groups  # Comma-separated group external IDs
         self.name = None  # Will be set by metaclass
         self.model_name = None  # Will be set by metaclass
-        self.kwargs = kwargs
 
         # Computed fields must have depends if stored
         if self.compute and not self.related:
@@ -91,7 +103,20 @@ class Field:
         """Get field value from instance"""
         if instance is None:
             return self
-        return instance._get_field_value(self.name)
+
+        # Fast path: single record with the value already cached
+        name = self.name
+        state = instance.__dict__
+        ids = state.get('_ids')
+        if ids and len(ids) == 1:
+            cache = state.get('_cache')
+            field_values = cache.get(name) if cache is not None else None
+            if field_values is not None:
+                value = field_values.get(ids[0], _MISSING)
+                if value is not _MISSING:
+                    return value
+
+        return instance._get_field_value(name)
 
     def __set__(self, instance, value):
         """Set field value on instance"""
@@ -122,6 +147,11 @@ class Field:
         """Convert value for cache storage"""
         return value
 
+    def convert_column_to_cache(self, values):
+        """Convert a whole column of values for cache storage"""
+        convert = self.convert_to_cache
+        return [convert(value) for value in values]
+
     def convert_from_cache(self, value):
         """Convert value from cache"""
         return value
@@ -143,6 +173,8 @@ class Char(Field):
         size: Maximum string length
         translate: Whether field is translatable
     """
+    __slots__ = ('size', 'translate')
+
     _field_type = 'char'
     _column_type = 'VARCHAR'
 
@@ -155,8 +187,13 @@ class Char(Field):
         return ''
 
     def validate(self, value):
-        super().validate(value)
-        if value and len(str(value)) > self.size:
+        # Required check inlined; this runs per field on every written row
+        if value is None:
+            if self.required:
+                raise ValueError(f"Field '{self.name}' is required")
+            return True
+        length = len(value) if type(value) is str else len(str(value))
+        if length > self.size:
             raise ValueError(f"Field '{self.name}' exceeds maximum size of {self.size}")
         return True
 
@@ -168,6 +205,8 @@ class Text(Field):
     Args:
         translate: Whether field is translatable
     """
+    __slots__ = ('translate',)
+
     _field_type = 'text'
     _column_type = 'TEXT'
 
@@ -181,6 +220,8 @@ class Text(Field):
 
 class Integer(Field):
     """Integer number field"""
+    __slots__ = ()
+
     _field_type = 'integer'
     _column_type = 'INTEGER'
 
@@ -188,10 +229,16 @@ class Integer(Field):
         return 0
 
     def convert_to_cache(self, value):
-        if value is None:
-            return None
+        if value is None or type(value) is int:
+            return value
         return int(value)
 
+    def convert_column_to_cache(self, values):
+        # map() keeps the cast loop in C when the column has no NULLs
+        if None in values:
+            return [None if value is None else int(value) for value in values]
+        return list(map(int, values))
+
 
 class Float(Field):
     """
@@ -200,6 +247,8 @@ class Float(Field):
     Args:
         digits: Tuple of (precision, scale) for decimal precision
     """
+    __slots__ = ('digits',)
+
     _field_type = 'float'
     _column_type = 'DOUBLE PRECISION'
 
@@ -211,13 +260,20 @@ class Float(Field):
         return 0.0
 
     def convert_to_cache(self, value):
-        if value is None:
-            return None
+        if value is None or type(value) is float:
+            return value
         return float(value)
 
+    def convert_column_to_cache(self, values):
+        if None in values:
+            return [None if value is None else float(value) for value in values]
+        return list(map(float, values))
+
 
 class Boolean(Field):
     """Boolean field"""
+    __slots__ = ()
+
     _field_type = 'boolean'
     _column_type = 'BOOLEAN'
 
@@ -229,9 +285,15 @@ class Boolean(Field):
             return False
         return bool(value)
 
+    def convert_column_to_cache(self, values):
+        # bool(None) is already False
+        return list(map(bool, values))
+
 
 class Date(Field):
     """Date field (without time)"""
+    __slots__ = ()
+
     _field_type = 'date'
     _column_type = 'DATE'
 
@@ -239,7 +301,10 @@ class Date(Field):
         if value is None:
             return None
         if isinstance(value, str):
-            return datetime.strptime(value, '%Y-%m-%d').date()
+            try:
+                return date.fromisoformat(value)
+            except ValueError:
+                return datetime.strptime(value, '%Y-%m-%d').date()
         if isinstance(value, datetime):
             return value.date()
         return value
@@ -256,6 +321,8 @@ class Date(Field):
 
 class DateTime(Field):
     """DateTime field (with time)"""
+    __slots__ = ()
+
     _field_type = 'datetime'
     _column_type = 'TIMESTAMP'
 
@@ -263,8 +330,13 @@ class DateTime(Field):
         if value is None:
             return None
         if isinstance(value, str):
+            # ISO 8601 (either separator, optional microseconds) in C
+            try:
+                return datetime.fromisoformat(value)
+            except ValueError:
+                pass
             # Try common datetime formats
-            for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S.%f']:
+            for fmt in _DATETIME_FORMATS:
                 try:
                     return datetime.strptime(value, fmt)
                 except ValueError:
@@ -272,6 +344,19 @@ class DateTime(Field):
             raise ValueError(f"Cannot parse datetime: {value}")
         return value
 
+    def convert_column_to_cache(self, values):
+        # Drivers without a native timestamp type (and bulk imports) hand
+        # over uniform ISO 8601 strings; parse the column in one C-level
+        # pass and only fall back per value on a miss. Columns that already
+        # hold datetimes (asyncpg) skip the attempt.
+        convert = self.convert_to_cache
+        if values and type(values[0]) is str:
+            try:
+                return list(map(datetime.fromisoformat, values))
+            except (TypeError, ValueError):
+                pass
+        return [convert(value) for value in values]
+
     def convert_to_database(self, value):
         if value is None:
             return None
@@ -284,6 +369,8 @@ class DateTime(Field):
 
 class Binary(Field):
     """Binary data field (files, images, etc.)"""
+    __slots__ = ('attachment',)
+
     _field_type = 'binary'
     _column_type = 'BYTEA'
 
@@ -299,6 +386,8 @@ class Selection(Field):
     Args:
         selection: List of (value, label) tuples or method name returning such list
     """
+    __slots__ = ('selection',)
+
     _field_type = 'selection'
     _column_type = 'VARCHAR'
 
@@ -314,14 +403,6 @@ class Selection(Field):
             return method()
         return self.selection
 
-    def validate(self, value):
-        super().validate(value)
-        if value is not None:
-            # Note: We can't validate selection here without model instance
-            # Validation will be done at model level
-            pass
-        return True
-
 
 class Many2one(Field):
     """
@@ -332,6 +413,8 @@ class Many2one(Field):
         ondelete: Action when related record is deleted ('set null', 'restrict', 'cascade')
         domain: Domain filter for related records
     """
+    __slots__ = ('comodel_name', 'ondelete', 'domain')
+
     _field_type = 'many2one'
     _column_type = 'INTEGER'
 
@@ -360,6 +443,8 @@ class One2many(Field):
         inverse_name: Name of the Many2one field on related model
         domain: Domain filter for related records
     """
+    __slots__ = ('comodel_name', 'inverse_name', 'domain')
+
     _field_type = 'one2many'
     _column_type = None  # No column, virtual field
 
@@ -390,6 +475,8 @@ class Many2many(Field):
         column2: Name of the column referencing the related model
         domain: Domain filter for related records
     """
+    __slots__ = ('comodel_name', 'relation', 'column1', 'column2', 'domain')
+
     _field_type = 'many2many'
     _column_type = None  # Uses junction table
 
@@ -4,12 +4,15 @@ Base Model class and metaclass for ORM
 Models are defined as Python classes with field descriptors.
 The metaclass handles model registration, field collection, and table creation.
 """
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+import asyncio
+import functools
 import logging
-from sqlalchemy import text, Table, Column, Integer, String, Text as SQLText, \
+from sqlalchemy import bindparam, insert, text, Table, Column, Integer, String, Text as SQLText, \
     Float as SQLFloat, Boolean as SQLBoolean, Date as SQLDate, DateTime as SQLDateTime, \
     LargeBinary, ForeignKey, MetaData, Index
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import TextClause
 
 from .fields import Field, Char, Text, Integer as IntegerField, Float, Boolean, \
     Date, DateTime, Binary, Selection, Many2one, One2many, Many2many
@@ -19,14 +22,56 @@ from .domain import domain_to_sql
 
 logger = logging.getLogger(__name__)
 
+# WHERE clauses with :pN binds, keyed by the %s SQL template
+_where_cache: Dict[str, str] = {}
+_WHERE_CACHE_SIZE = 2048
+
+# Record groups at least this large are loaded with COPY on PostgreSQL
+_COPY_THRESHOLD = 100
+
+
+# SQLAlchemy column type for each field class
+_FIELD_TO_SQL = {
+    Char: lambda field: String(field.size),
+    Text: lambda field: SQLText,
+    IntegerField: lambda field: Integer,
+    Float: lambda field: SQLFloat,
+    Boolean: lambda field: SQLBoolean,
+    Date: lambda field: SQLDate,
+    DateTime: lambda field: SQLDateTime,
+    Binary: lambda field: LargeBinary,
+    Selection: lambda field: String(255),
+    Many2one: lambda field: Integer,
+}
+
+
+def _column_type_factory(field_class: type):
+    """Column type factory for a field class, inherited along the MRO"""
+    for klass in field_class.__mro__:
+        factory = _FIELD_TO_SQL.get(klass)
+        if factory is not None:
+            return factory
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _compiled(sql: str) -> TextClause:
+    """text() construct for a SQL string, built once per distinct string"""
+    return text(sql)
+
+
+@functools.lru_cache(maxsize=256)
+def _compiled_in(sql: str) -> TextClause:
+    """text() construct whose :record_ids list expands into an IN list"""
+    return text(sql).bindparams(bindparam('record_ids', expanding=True))
+
 
 def _get_access_controller(env: Environment):
     """Get access controller for security checks.
 
-    Lazy import to avoid circular dependencies.
+    The environment keeps one controller for all of its checks.
     """
-    from openflow.server.core.security import AccessController
-    return AccessController(env)
+    return env.access
 
 
 class ModelMetaclass(type):
@@ -77,6 +122,29 @@ class ModelMetaclass(type):
             id_field.model_name = model_name
             cls._fields['id'] = id_field
 
+        # Per-class SQL pieces that only depend on the schema
+        table_name = cls._get_table_name()
+        cls._table_name_cached = table_name
+        # Own MetaData so creating this table never touches other models'
+        cls._metadata = MetaData()
+        cls._stored_fields = tuple(
+            field_name for field_name, field in cls._fields.items() if field.store
+        )
+        cls._read_all_query = text(
+            f"SELECT {', '.join(cls._stored_fields)} FROM {table_name} "
+            f"WHERE id = ANY(:record_ids)"
+        )
+
+        # Field lists create() walks for every record
+        cls._required_fields = tuple(
+            field_name for field_name, field in cls._fields.items()
+            if field.required and field_name != 'id'
+        )
+        cls._default_fields = tuple(
+            (field_name, field) for field_name, field in cls._fields.items()
+            if field.store and field_name != 'id'
+        )
+
         # Register model
         registry.register(model_name, cls)
 
@@ -121,6 +189,13 @@ class Model(metaclass=ModelMetaclass):
     _fields: Dict[str, Field] = {}
     _metadata: MetaData = MetaData()
 
+    # Filled in by ModelMetaclass for each model class
+    _table_name_cached: Optional[str] = None
+    _stored_fields: Tuple[str, ...] = ()
+    _read_all_query = None
+    _required_fields: Tuple[str, ...] = ()
+    _default_fields: Tuple[Tuple[str, Field], ...] = ()
+
     def __init__(self, ids: Optional[List[int]] = None, env: Optional[Environment] = None):
         """
         Initialize model (returns RecordSet)
@@ -152,22 +227,26 @@ class Model(metaclass=ModelMetaclass):
     @classmethod
     def _get_table_name(cls) -> str:
         """Get database table name"""
+        table_name = cls.__dict__.get('_table_name_cached')
+        if table_name is not None:
+            return table_name
         if cls._table:
             return cls._table
         # Convert model name to table name (replace dots with underscores)
         return cls._name.replace('.', '_')
 
     @classmethod
-    async def _create_table(cls, engine) -> Table:
+    def _get_table(cls) -> Table:
         """
-        Create SQLAlchemy table schema
-
-        Args:
-            engine: Database engine
+        SQLAlchemy table schema for this model, built once per class
 
         Returns:
             Table object
         """
+        table = cls.__dict__.get('_table_schema')
+        if table is not None:
+            return table
+
         table_name = cls._get_table_name()
         columns = []
         indexes = []
@@ -182,26 +261,9 @@ class Model(metaclass=ModelMetaclass):
                 continue
 
             # Get column type
-            if isinstance(field, Char):
-                col_type = String(field.size)
-            elif isinstance(field, Text):
-                col_type = SQLText
-            elif isinstance(field, IntegerField):
-                col_type = Integer
-            elif isinstance(field, Float):
-                col_type = SQLFloat
-            elif isinstance(field, Boolean):
-                col_type = SQLBoolean
-            elif isinstance(field, Date):
-                col_type = SQLDate
-            elif isinstance(field, DateTime):
-                col_type = SQLDateTime
-            elif isinstance(field, Binary):
-                col_type = LargeBinary
-            elif isinstance(field, Selection):
-                col_type = String(255)
-            elif isinstance(field, Many2one):
-                col_type = Integer
+            factory = _column_type_factory(type(field))
+            if factory is not None:
+                col_type = factory(field)
             else:
                 logger.warning(f"Unknown field type for {field_name}, using String")
                 col_type = String(255)
@@ -220,12 +282,26 @@ class Model(metaclass=ModelMetaclass):
                 index = Index(f'idx_{table_name}_{field_name}', field_name)
                 indexes.append(index)
 
-        # Create table
         table = Table(table_name, cls._metadata, *columns, *indexes)
+        cls._table_schema = table
+        return table
+
+    @classmethod
+    async def _create_table(cls, engine) -> Table:
+        """
+        Create SQLAlchemy table schema
+
+        Args:
+            engine: Database engine
 
-        # Create table in database
+        Returns:
+            Table object
+        """
+        table = cls._get_table()
+
+        # Create only this table in database
         async with engine.begin() as conn:
-            await conn.run_sync(cls._metadata.create_all)
+            await conn.run_sync(lambda sync_conn: table.create(sync_conn, checkfirst=True))
 
         return table
 
@@ -247,43 +323,147 @@ class Model(metaclass=ModelMetaclass):
         if not isinstance(vals, list):
             vals = [vals]
 
-        created_ids = []
-        session: AsyncSession = self._env.session
-
-        for values in vals:
-            # Apply defaults
-            record_values = {}
-            for field_name, field in self._fields.items():
-                if field_name in values:
-                    record_values[field_name] = values[field_name]
-                elif field_name != 'id' and field.store:
-                    default = field.get_default(self)
-                    if default is not None:
-                        record_values[field_name] = default
-
-            # Validate required fields
-            for field_name, field in self._fields.items():
-                if field.required and field_name != 'id':
-                    if field_name not in record_values or record_values[field_name] is None:
-                        raise ValueError(f"Required field '{field_name}' is missing")
-
-            # Build INSERT query
+        async with self._env._acquire() as session:
             table_name = self._get_table_name()
-            columns = [k for k in record_values.keys() if k != 'id']
-            values_str = ', '.join([f':{k}' for k in columns])
-            columns_str = ', '.join(columns)
+            model_fields = self._fields
+            required_fields = self._required_fields
+            default_fields = self._default_fields
+
+            # Records are inserted together when they set the same columns,
+            # remembering their position so ids come back in input order
+            groups: Dict[frozenset, Tuple[Tuple[str, ...], List[Tuple[int, Dict[str, Any]]]]] = {}
+
+            for position, values in enumerate(vals):
+                # Given values for known fields, then defaults for the rest
+                record_values = {
+                    field_name: value for field_name, value in values.items()
+                    if field_name in model_fields
+                }
+                for field_name, field in default_fields:
+                    if field_name not in record_values:
+                        default = field.get_default(self)
+                        if default is not None:
+                            record_values[field_name] = default
+
+                # Validate required fields
+                if None in map(record_values.get, required_fields):
+                    for field_name in required_fields:
+                        if record_values.get(field_name) is None:
+                            raise ValueError(f"Required field '{field_name}' is missing")
+
+                key = frozenset(record_values)
+                group = groups.get(key)
+                if group is None:
+                    columns = tuple(k for k in record_values if k != 'id')
+                    group = groups[key] = (columns, [])
+                group[1].append((position, record_values))
+
+            use_copy = self._supports_copy(session)
+            created_ids = [None] * len(vals)
+            for columns, rows in groups.values():
+                if use_copy and len(rows) >= _COPY_THRESHOLD:
+                    record_ids = await self._copy_rows(
+                        session, table_name, columns, [record for _, record in rows]
+                    )
+                    for (position, _), record_id in zip(rows, record_ids, strict=True):
+                        created_ids[position] = record_id
+                    continue
+
+                record_ids = await self._insert_rows(
+                    session, columns, [record for _, record in rows]
+                )
+                for (position, _), record_id in zip(rows, record_ids, strict=True):
+                    created_ids[position] = record_id
+
+            await session.commit()
+
+            # Return recordset with created records
+            return RecordSet(self.__class__, created_ids, self._cache)
 
-            query = f"INSERT INTO {table_name} ({columns_str}) VALUES ({values_str}) RETURNING id"
+    @classmethod
+    async def _insert_rows(
+        cls,
+        session: AsyncSession,
+        columns: Tuple[str, ...],
+        rows: List[Dict[str, Any]]
+    ) -> List[int]:
+        """
+        Insert rows sharing a column set with batched multi-row INSERTs
 
-            # Execute query
-            result = await session.execute(text(query), record_values)
-            record_id = result.scalar()
-            created_ids.append(record_id)
+        RETURNING does not promise rows in VALUES order, so the statement
+        asks SQLAlchemy to sort them by parameter order. Its insertmanyvalues
+        mode then adds an ordering sentinel to each multi-row INSERT and
+        pages the rows to stay within the driver's bind parameter limit.
+
+        Args:
+            session: Database session
+            columns: Columns set by every row
+            rows: Values of each row, keyed by column
+
+        Returns:
+            IDs of the inserted rows, in row order
+        """
+        table = cls._get_table()
+        if 'id' in rows[0]:
+            # Given ids are not inserted; the sequence assigns them
+            rows = [{column: row[column] for column in columns} for row in rows]
+
+        statement = insert(table).returning(table.c.id, sort_by_parameter_order=True)
+        result = await session.execute(statement, rows)
+        return list(result.scalars().all())
+
+    @staticmethod
+    def _supports_copy(session: AsyncSession) -> bool:
+        """Whether the session's connection can bulk load with COPY"""
+        dialect = getattr(session.bind, 'dialect', None)
+        return (
+            dialect is not None
+            and dialect.name == 'postgresql'
+            and dialect.driver == 'asyncpg'
+        )
+
+    @staticmethod
+    async def _copy_rows(
+        session: AsyncSession,
+        table_name: str,
+        columns: Tuple[str, ...],
+        rows: List[Dict[str, Any]]
+    ) -> List[int]:
+        """
+        Insert rows sharing a column set with PostgreSQL COPY
+
+        COPY cannot return generated keys, so IDs are drawn from the
+        table's id sequence first and loaded along with the rows. Values
+        must already have their column's Python type, as asyncpg encodes
+        them in binary.
 
-        await session.commit()
+        Args:
+            session: Database session on an asyncpg connection
+            table_name: Table to insert into
+            columns: Columns set by every row
+            rows: Values of each row, keyed by column
 
-        # Return recordset with created records
-        return RecordSet(self.__class__, created_ids, self._cache)
+        Returns:
+            IDs of the inserted rows, in row order
+        """
+        result = await session.execute(
+            _compiled("SELECT nextval(pg_get_serial_sequence(:table_name, 'id')) "
+                 "FROM generate_series(1, :count)"),
+            {'table_name': table_name, 'count': len(rows)}
+        )
+        record_ids = list(result.scalars().all())
+
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            table_name,
+            records=[
+                (record_id, *[row[column] for column in columns])
+                for record_id, row in zip(record_ids, rows, strict=True)
+            ],
+            columns=['id', *columns],
+        )
+        return record_ids
 
     async def write(self, vals: Dict[str, Any]) -> bool:
         """
@@ -303,36 +483,116 @@ class Model(metaclass=ModelMetaclass):
             access_controller = _get_access_controller(self._env)
             access_controller.check_model_access(self._name, 'write')
 
-        session: AsyncSession = self._env.session
+        async with self._env._acquire() as session:
+            # Validate readonly fields
+            for field_name in vals.keys():
+                if field_name in self._fields:
+                    field = self._fields[field_name]
+                    if field.readonly and not self._allow_readonly_write:
+                        raise ValueError(f"Field '{field_name}' is readonly")
+
+            # Build UPDATE query
+            table_name = self._get_table_name()
+            set_parts = [f"{k} = :{k}" for k in vals.keys()]
+            set_clause = ', '.join(set_parts)
+
+            query = f"UPDATE {table_name} SET {set_clause} WHERE id = ANY(:record_ids)"
+
+            # Combine parameters; the IDs bind as a single array
+            params = {**vals, 'record_ids': list(self._ids)}
 
-        # Validate readonly fields
-        for field_name in vals.keys():
-            if field_name in self._fields:
-                field = self._fields[field_name]
-                if field.readonly and not self._allow_readonly_write:
-                    raise ValueError(f"Field '{field_name}' is readonly")
+            # Execute query
+            await session.execute(_compiled(query), params)
+            await session.commit()
 
-        # Build UPDATE query
-        table_name = self._get_table_name()
-        set_parts = [f"{k} = :{k}" for k in vals.keys()]
-        set_clause = ', '.join(set_parts)
+            # Keep values read into the record cache current
+            for field_name, value in vals.items():
+                field = self._fields.get(field_name)
+                if field is not None:
+                    self._cache.setdefault(field_name, {}).update(
+                        dict.fromkeys(self._ids, field.convert_to_cache(value))
+                    )
 
-        placeholders = ', '.join([':id' + str(i) for i in range(len(self._ids))])
-        id_params = {f'id{i}': id_val for i, id_val in enumerate(self._ids)}
+            # Invalidate cache
+            self._env.invalidate_cache()
 
-        query = f"UPDATE {table_name} SET {set_clause} WHERE id IN ({placeholders})"
+            return True
 
-        # Combine parameters
-        params = {**vals, **id_params}
+    async def write_many(self, rows: List[Dict[str, Any]]) -> bool:
+        """
+        Update several records, each with its own values
 
-        # Execute query
-        await session.execute(text(query), params)
-        await session.commit()
+        Consecutive rows setting the same fields share one UPDATE
+        statement, executed once with a list of parameter sets so the
+        driver can batch them. Rows are applied in the order given.
 
-        # Invalidate cache
-        self._env.invalidate_cache()
+        Args:
+            rows: Dictionaries of field values, each with the record 'id'
 
-        return True
+        Returns:
+            True if successful
+
+        Raises:
+            ValueError: If a row has no 'id', or writes a field that is
+                readonly or has no column
+        """
+        if not rows:
+            return True
+
+        # Check write access
+        if self._env and self._env.user:
+            access_controller = _get_access_controller(self._env)
+            access_controller.check_model_access(self._name, 'write')
+
+        # Split rows into runs setting the same fields
+        columns = self._get_table().c
+        batches: List[List[Dict[str, Any]]] = []
+        validated = set()
+        key = None
+        for row in rows:
+            if row.get('id') is None:
+                raise ValueError("Each row passed to write_many needs an 'id'")
+            row_key = frozenset(row)
+            if row_key != key:
+                if row_key not in validated:
+                    for field_name in row_key:
+                        if field_name == 'id':
+                            continue
+                        # Keys become column names in the SQL text
+                        if field_name not in columns:
+                            raise ValueError(
+                                f"Field '{field_name}' is not a stored field of '{self._name}'"
+                            )
+                        if self._fields[field_name].readonly and not self._allow_readonly_write:
+                            raise ValueError(f"Field '{field_name}' is readonly")
+                    validated.add(row_key)
+                key = row_key
+                batches.append([])
+            batches[-1].append(row)
+
+        async with self._env._acquire() as session:
+            table_name = self._get_table_name()
+            for batch in batches:
+                set_clause = ', '.join(f"{k} = :{k}" for k in batch[0] if k != 'id')
+                if not set_clause:
+                    continue
+                query = f"UPDATE {table_name} SET {set_clause} WHERE id = :id"
+                await session.execute(_compiled(query), batch)
+
+            await session.commit()
+
+            # Keep values read into the record cache current
+            cache = self._cache
+            for row in rows:
+                for field_name, value in row.items():
+                    if field_name != 'id':
+                        field = self._fields[field_name]
+                        cache.setdefault(field_name, {})[row['id']] = field.convert_to_cache(value)
+
+            # Invalidate cache
+            self._env.invalidate_cache()
+
+            return True
 
     async def unlink(self) -> bool:
         """
@@ -349,23 +609,19 @@ class Model(metaclass=ModelMetaclass):
             access_controller = _get_access_controller(self._env)
             access_controller.check_model_access(self._name, 'unlink')
 
-        session: AsyncSession = self._env.session
-
-        # Build DELETE query
-        table_name = self._get_table_name()
-        placeholders = ', '.join([':id' + str(i) for i in range(len(self._ids))])
-        params = {f'id{i}': id_val for i, id_val in enumerate(self._ids)}
-
-        query = f"DELETE FROM {table_name} WHERE id IN ({placeholders})"
+        async with self._env._acquire() as session:
+            # Build DELETE query
+            table_name = self._get_table_name()
+            query = f"DELETE FROM {table_name} WHERE id = ANY(:record_ids)"
 
-        # Execute query
-        await session.execute(text(query), params)
-        await session.commit()
+            # Execute query
+            await session.execute(_compiled(query), {'record_ids': list(self._ids)})
+            await session.commit()
 
-        # Clear IDs
-        self._ids = []
+            # Clear IDs
+            self._ids = []
 
-        return True
+            return True
 
     async def read(self, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
@@ -385,42 +641,39 @@ class Model(metaclass=ModelMetaclass):
             access_controller = _get_access_controller(self._env)
             access_controller.check_model_access(self._name, 'read')
 
-        session: AsyncSession = self._env.session
-
-        # Determine fields to read
-        if fields is None:
-            fields = [name for name, field in self._fields.items() if field.store]
-        else:
-            # Ensure 'id' is included
-            if 'id' not in fields:
-                fields = ['id'] + fields
-
-        # Apply field-level security
-        if self._env and self._env.user:
-            access_controller = _get_access_controller(self._env)
-            fields = access_controller.filter_fields(self._name, fields)
-
-        # Build SELECT query
-        table_name = self._get_table_name()
-        columns = ', '.join(fields)
-        placeholders = ', '.join([':id' + str(i) for i in range(len(self._ids))])
-        params = {f'id{i}': id_val for i, id_val in enumerate(self._ids)}
-
-        query = f"SELECT {columns} FROM {table_name} WHERE id IN ({placeholders})"
-
-        # Execute query
-        result = await session.execute(text(query), params)
-        rows = result.fetchall()
+        async with self._env._acquire() as session:
+            # Determine fields to read
+            related_fields = []
+            if fields is None:
+                fields = list(self._stored_fields)
+            else:
+                # Related fields without a column are resolved afterwards
+                related_fields = self._related_fields(fields)
+                fields = [name for name in fields if name not in related_fields]
+                # Ensure 'id' is included
+                if 'id' not in fields:
+                    fields = ['id'] + fields
+
+            # Apply field-level security
+            if self._env and self._env.user:
+                access_controller = _get_access_controller(self._env)
+                fields = access_controller.filter_fields(self._name, fields)
+
+            # Build SELECT query, reusing the class statement for all fields
+            if tuple(fields) == self._stored_fields:
+                query = self._read_all_query
+            else:
+                query = _compiled(
+                    f"SELECT {', '.join(fields)} FROM {self._get_table_name()} "
+                    f"WHERE id = ANY(:record_ids)"
+                )
 
-        # Convert to list of dicts
-        records = []
-        for row in rows:
-            record = {}
-            for i, field_name in enumerate(fields):
-                record[field_name] = row[i]
-            records.append(record)
+            # Execute query
+            result = await session.execute(query, {'record_ids': list(self._ids)})
+            rows = self._load_rows(fields, result.fetchall())
 
-        return records
+        await self._prefetch_related(rows, related_fields)
+        return rows
 
     async def search(
         self,
@@ -441,66 +694,161 @@ class Model(metaclass=ModelMetaclass):
         Returns:
             RecordSet with matching records
         """
-        # Check read access
-        if self._env and self._env.user:
-            access_controller = _get_access_controller(self._env)
-            access_controller.check_model_access(self._name, 'read')
+        ids = await self.search_ids(domain, offset=offset, limit=limit, order=order)
+        return RecordSet(self.__class__, ids, self._cache)
 
-            # Apply record rules (row-level security)
-            domain = access_controller.apply_record_rules(
-                self._name,
-                'read',
-                domain
+    async def search_ids(
+        self,
+        domain: List = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        order: Optional[str] = None
+    ) -> List[int]:
+        """
+        Search for IDs of records matching domain
+
+        Same as search() but returns the plain list of IDs, for callers
+        that do not need a RecordSet.
+
+        Args:
+            domain: Search domain (None = all records)
+            offset: Number of records to skip
+            limit: Maximum number of records to return
+            order: Order clause (e.g., 'name ASC, id DESC')
+
+        Returns:
+            List of matching record IDs
+        """
+        domain = self._search_domain(domain)
+        async with self._env._acquire() as session:
+            # Build SELECT query
+            table_name = self._get_table_name()
+            where_clause, params = self._where_clause(domain, table_name)
+            query = (
+                f"SELECT id FROM {table_name}{where_clause}"
+                f"{self._order_clause(offset, limit, order)}"
             )
 
-            # Apply multi-company filtering if model has company_id field
-            if self._check_company_auto and 'company_id' in self._fields:
-                # Check if company filter is already in domain
-                has_company_filter = False
-                if domain:
-                    for item in domain:
-                        if isinstance(item, tuple) and item[0] == 'company_id':
-                            has_company_filter = True
-                            break
+            # Execute query
+            result = await session.execute(_compiled(query), params)
+            return list(result.scalars().all())
 
-                # Apply automatic company filtering if not already present
-                if not has_company_filter:
-                    domain = access_controller.apply_company_filter(domain)
+    async def search_read(
+        self,
+        domain: List = None,
+        fields: Optional[List[str]] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        order: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for records and read their field values in a single query
 
-        session: AsyncSession = self._env.session
+        Args:
+            domain: Search domain (None = all records)
+            fields: List of field names to read (None = all stored fields)
+            offset: Number of records to skip
+            limit: Maximum number of records to return
+            order: Order clause (e.g., 'name ASC, id DESC')
 
-        # Build SELECT query
-        table_name = self._get_table_name()
-        query = f"SELECT id FROM {table_name}"
+        Returns:
+            List of dictionaries with field values
+        """
+        domain = self._search_domain(domain)
+        async with self._env._acquire() as session:
+            # Determine fields to read (only stored fields have columns)
+            related_fields = []
+            if fields is None:
+                fields = list(self._stored_fields)
+            else:
+                related_fields = self._related_fields(fields)
+                fields = ['id'] + [
+                    name for name in fields
+                    if name != 'id' and name in self._fields and self._fields[name].store
+                ]
+
+            # Apply field-level security
+            if self._env and self._env.user:
+                access_controller = _get_access_controller(self._env)
+                fields = access_controller.filter_fields(self._name, fields)
+
+            # Build SELECT query
+            table_name = self._get_table_name()
+            where_clause, params = self._where_clause(domain, table_name)
+            query = (
+                f"SELECT {', '.join(fields)} FROM {table_name}{where_clause}"
+                f"{self._order_clause(offset, limit, order)}"
+            )
 
-        # Add WHERE clause
-        params = {}
-        if domain:
-            where_clause, where_params = domain_to_sql(domain, self.__class__, table_name)
-            query += f" WHERE {where_clause}"
-            params.update({f'p{i}': p for i, p in enumerate(where_params)})
-            # Replace %s with :pN
-            for i in range(len(where_params)):
-                query = query.replace('%s', f':p{i}', 1)
+            # Execute query
+            result = await session.execute(_compiled(query), params)
+            rows = self._load_rows(fields, result.fetchall())
+
+        await self._prefetch_related(rows, related_fields)
+        return rows
+
+    def _related_fields(self, fields: List[str]) -> List[str]:
+        """Requested related fields that have no column of their own"""
+        model_fields = self._fields
+        return [
+            name for name in fields
+            if name in model_fields and model_fields[name].related
+            and not model_fields[name].store
+        ]
+
+    async def _prefetch_related(self, rows: List[Dict[str, Any]], related_fields: List[str]):
+        """
+        Resolve related fields for all rows and add them to each row
 
-        # Add ORDER BY clause
-        if order:
-            query += f" ORDER BY {order}"
-        elif self._order:
-            query += f" ORDER BY {self._order}"
+        Every related path is resolved for all rows at once through
+        _resolve_related, which also fills the record cache.
 
-        # Add LIMIT and OFFSET
-        if limit:
-            query += f" LIMIT {limit}"
-        if offset:
-            query += f" OFFSET {offset}"
+        Args:
+            rows: Rows as returned by _load_rows, each with an 'id'
+            related_fields: Related field names to resolve
+        """
+        if not rows or not related_fields:
+            return
 
-        # Execute query
-        result = await session.execute(text(query), params)
-        rows = result.fetchall()
-        ids = [row[0] for row in rows]
+        records = type(self)(ids=[row['id'] for row in rows], env=self._env)
+        records._cache = self._cache
+        for field_name in related_fields:
+            values = await records._resolve_related(self._fields[field_name].related, field_name)
+            for row in rows:
+                row[field_name] = values[row['id']]
 
-        return RecordSet(self.__class__, ids, self._cache)
+    def _load_rows(self, fields: List[str], rows: List[Tuple]) -> List[Dict[str, Any]]:
+        """
+        Convert fetched rows column by column and store them in the cache
+
+        Each column goes through its field's convert_column_to_cache in one
+        pass, rather than converting value by value, and lands in the
+        record cache so field access on the records is served from memory.
+
+        Args:
+            fields: Field names, in column order
+            rows: Rows returned by the SELECT
+
+        Returns:
+            List of dictionaries with converted field values
+        """
+        if not rows:
+            return []
+
+        model_fields = self._fields
+        columns = [
+            model_fields[field_name].convert_column_to_cache(list(column))
+            for field_name, column in zip(fields, zip(*rows, strict=True), strict=True)
+        ]
+
+        if 'id' in fields:
+            record_ids = columns[fields.index('id')]
+            cache = self._cache
+            for field_name, values in zip(fields, columns, strict=True):
+                if field_name != 'id':
+                    cache.setdefault(field_name, {}).update(zip(record_ids, values, strict=True))
+
+        return [dict(zip(fields, row, strict=True)) for row in zip(*columns, strict=True)]
 
     async def search_count(self, domain: List = None) -> int:
         """
@@ -512,7 +860,33 @@ class Model(metaclass=ModelMetaclass):
         Returns:
             Number of matching records
         """
-        # Check read access and apply record rules
+        domain = self._search_domain(domain)
+        async with self._env._acquire() as session:
+            # Build COUNT query
+            table_name = self._get_table_name()
+            where_clause, params = self._where_clause(domain, table_name)
+            query = f"SELECT COUNT(*) FROM {table_name}{where_clause}"
+
+            # Execute query
+            result = await session.execute(_compiled(query), params)
+            count = result.scalar()
+
+            return count
+
+    def _search_domain(self, domain: List = None) -> List:
+        """
+        Check read access and restrict a search domain for the current user
+
+        Applies record rules and, for models with a company_id field,
+        multi-company filtering.
+
+        Args:
+            domain: Search domain requested by the caller
+
+        Returns:
+            Domain to search with
+        """
+        # Check read access
         if self._env and self._env.user:
             access_controller = _get_access_controller(self._env)
             access_controller.check_model_access(self._name, 'read')
@@ -538,27 +912,62 @@ class Model(metaclass=ModelMetaclass):
                 if not has_company_filter:
                     domain = access_controller.apply_company_filter(domain)
 
-        session: AsyncSession = self._env.session
+        return domain
+
+    def _where_clause(self, domain: List, table_name: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        Build the WHERE clause for a search domain
+
+        Args:
+            domain: Search domain
+            table_name: Table the domain columns are qualified with
+
+        Returns:
+            Tuple of (' WHERE ...' or '', bind parameters)
+        """
+        if not domain:
+            return '', {}
+
+        # domain_to_sql compiles once per domain shape, only literals differ
+        sql, where_params = domain_to_sql(domain, self.__class__, table_name)
+        where_clause = _where_cache.get(sql)
 
-        # Build COUNT query
-        table_name = self._get_table_name()
-        query = f"SELECT COUNT(*) FROM {table_name}"
+        if where_clause is None:
+            # Replace %s with :pN in a single pass
+            parts = sql.split('%s')
+            where_clause = ''.join(
+                f"{part}:p{i}" for i, part in enumerate(parts[:-1])
+            ) + parts[-1]
+
+            if len(_where_cache) >= _WHERE_CACHE_SIZE:
+                _where_cache.clear()
+            _where_cache[sql] = where_clause
+
+        params = {f'p{i}': p for i, p in enumerate(where_params)}
+        return f" WHERE {where_clause}", params
+
+    def _order_clause(
+        self,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        order: Optional[str] = None
+    ) -> str:
+        """Build the ORDER BY / LIMIT / OFFSET tail of a search query"""
+        query = ''
 
-        # Add WHERE clause
-        params = {}
-        if domain:
-            where_clause, where_params = domain_to_sql(domain, self.__class__, table_name)
-            query += f" WHERE {where_clause}"
-            params.update({f'p{i}': p for i, p in enumerate(where_params)})
-            # Replace %s with :pN
-            for i in range(len(where_params)):
-                query = query.replace('%s', f':p{i}', 1)
+        # Add ORDER BY clause
+        if order:
+            query += f" ORDER BY {order}"
+        elif self._order:
+            query += f" ORDER BY {self._order}"
 
-        # Execute query
-        result = await session.execute(text(query), params)
-        count = result.scalar()
+        # Add LIMIT and OFFSET
+        if limit:
+            query += f" LIMIT {limit}"
+        if offset:
+            query += f" OFFSET {offset}"
 
-        return count
+        return query
 
     @classmethod
     def browse(cls, ids: Union[int, List[int]], env: Optional[Environment] = None) -> 'RecordSet':
@@ -572,11 +981,8 @@ class Model(metaclass=ModelMetaclass):
         Returns:
             RecordSet with specified IDs
         """
-        if isinstance(ids, int):
-            ids = [ids]
-
-        instance = cls(ids=ids, env=env)
-        return RecordSet(cls, ids, instance._cache)
+        # No throwaway Model instance: its only contribution was an empty cache
+        return RecordSet(cls, [ids] if isinstance(ids, int) else ids)
 
     def _get_field_value(self, field_name: str) -> Any:
         """Get field value (used by RecordSet)"""
@@ -587,16 +993,16 @@ class Model(metaclass=ModelMetaclass):
 
         # Check cache
         if self._ids and len(self._ids) == 1:
-            cache_key = (self._ids[0], field_name)
-            if cache_key in self._cache:
-                return self._cache[cache_key]
+            field_values = self._cache.get(field_name)
+            if field_values is not None and self._ids[0] in field_values:
+                return field_values[self._ids[0]]
 
         # Computed field
         if field.compute and not field.related:
             compute_method = getattr(self, field.compute)
             value = compute_method()
             if self._ids and len(self._ids) == 1:
-                self._cache[(self._ids[0], field_name)] = value
+                self._cache.setdefault(field_name, {})[self._ids[0]] = value
             return value
 
         # Related field
@@ -612,6 +1018,81 @@ class Model(metaclass=ModelMetaclass):
         # This is a placeholder - in real implementation would fetch from DB
         return None
 
+    async def _resolve_related(
+        self,
+        related_path: str,
+        field_name: Optional[str] = None
+    ) -> Dict[int, Any]:
+        """
+        Resolve a related path for all records, one query per hop
+
+        Each hop reads the next column for every distinct ID reached so
+        far, so a path of depth D costs at most D queries regardless of the
+        number of records; the first hop is skipped when its column is
+        already cached. The first hop is stored in the record cache, as is
+        the final value when field_name is given, so later reads of those
+        fields are served from memory.
+
+        Args:
+            related_path: Dotted path of Many2one fields ending in any
+                stored field (e.g., 'partner_id.company_id.name')
+            field_name: Related field to cache the resolved values under
+
+        Returns:
+            Mapping of record ID to the value at the end of the path
+
+        Raises:
+            ValueError: If a hop is unknown, not stored, or not a Many2one
+        """
+        parts = related_path.split('.')
+        model_class = type(self)
+        # Record ID -> ID reached in the current hop's model
+        reached = {record_id: record_id for record_id in self._ids}
+        values: Dict[Any, Any] = {}
+
+        async with self._env._acquire() as session:
+            for depth, part in enumerate(parts):
+                field = model_class._fields.get(part)
+                if field is None or not field.store:
+                    raise ValueError(
+                        f"Cannot resolve '{related_path}': '{part}' is not a stored "
+                        f"field of '{model_class._name}'"
+                    )
+
+                hop_ids = list({hop_id for hop_id in reached.values() if hop_id is not None})
+                values = {}
+                cached = self._cache.get(part) if depth == 0 else None
+                if cached is not None and all(record_id in cached for record_id in hop_ids):
+                    # First hop already loaded with the records
+                    values = {record_id: cached[record_id] for record_id in hop_ids}
+                elif hop_ids:
+                    result = await session.execute(
+                        _compiled_in(f"SELECT id, {part} FROM {model_class._get_table_name()} "
+                                     f"WHERE id IN :record_ids"),
+                        {'record_ids': hop_ids}
+                    )
+                    hop_rows = result.all()
+                    column = field.convert_column_to_cache([value for _, value in hop_rows])
+                    values = dict(zip([hop_id for hop_id, _ in hop_rows], column, strict=True))
+
+                if depth == 0:
+                    self._cache.setdefault(part, {}).update(
+                        (record_id, values.get(record_id)) for record_id in self._ids
+                    )
+
+                if depth == len(parts) - 1:
+                    break
+
+                if not isinstance(field, Many2one):
+                    raise ValueError(f"Cannot resolve '{related_path}': '{part}' is not a Many2one")
+                model_class = registry[field.comodel_name]
+                reached = {record_id: values.get(hop_id) for record_id, hop_id in reached.items()}
+
+        resolved = {record_id: values.get(hop_id) for record_id, hop_id in reached.items()}
+        if field_name:
+            self._cache.setdefault(field_name, {}).update(resolved)
+        return resolved
+
     def _set_field_value(self, field_name: str, value: Any):
         """Set field value (used by RecordSet)"""
         if field_name not in self._fields:
@@ -619,9 +1100,7 @@ class Model(metaclass=ModelMetaclass):
 
         # Update cache
         if self._ids:
-            for record_id in self._ids:
-                cache_key = (record_id, field_name)
-                self._cache[cache_key] = value
+            self._cache.setdefault(field_name, {}).update(dict.fromkeys(self._ids, value))
 
     @classmethod
     async def _get_field_value_from_db(cls, record_id: int, field_name: str) -> Any:
@@ -631,23 +1110,66 @@ class Model(metaclass=ModelMetaclass):
 
     def __getattr__(self, name):
         """Get field value or method"""
-        if name.startswith('_'):
-            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
-
-        if name in self._fields:
+        # Only reached when normal lookup failed; private names never map to fields
+        if name[:1] != '_' and name in type(self)._fields:
             return self._get_field_value(name)
 
         raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
 
     def __setattr__(self, name, value):
         """Set field value"""
-        # Allow setting internal attributes
-        if name.startswith('_') or name in ['_ids', '_env', '_cache', '_allow_readonly_write']:
-            super().__setattr__(name, value)
+        # Internal attributes (_ids, _env, _cache, ...) all start with '_'
+        if name[:1] == '_':
+            object.__setattr__(self, name, value)
             return
 
         # Set field value
-        if hasattr(self.__class__, '_fields') and name in self._fields:
+        if name in type(self)._fields:
             self._set_field_value(name, value)
         else:
-            super().__setattr__(name, value)
+            object.__setattr__(self, name, value)
+
+
+async def read_batch(
+    env: Environment,
+    requests: Dict[Type[Model], List[int]],
+    fields_by_model: Optional[Dict[Type[Model], List[str]]] = None
+) -> Dict[Type[Model], List[Dict[str, Any]]]:
+    """
+    Read records of several models in one concurrent fan-out
+
+    Each model is read with its own SELECT, filtering on the IDs through
+    search_read so the statement also runs where ANY() is unavailable.
+    When the environment has no session of its own, every read borrows a
+    separate pooled connection and all SELECTs run concurrently, so K
+    models cost roughly one round-trip instead of K. A single session
+    cannot run statements concurrently, so with an explicit session the
+    reads run in turn.
+
+    Args:
+        env: Environment to read with
+        requests: Record IDs to read, keyed by model class
+        fields_by_model: Fields to read per model class (missing = all stored fields)
+
+    Returns:
+        Rows as returned by Model.search_read, keyed by model class
+    """
+    fields_by_model = fields_by_model or {}
+
+    async def read_one(model_class: Type[Model], ids: List[int]) -> List[Dict[str, Any]]:
+        if not ids:
+            return []
+        if env.user:
+            _get_access_controller(env).check_model_access(model_class._name, 'read')
+        records = model_class(env=env)
+        domain = [('id', 'in', list(ids))]
+        return await records.search_read(domain, fields_by_model.get(model_class))
+
+    if env.session is not None:
+        results = [await read_one(model_class, ids) for model_class, ids in requests.items()]
+    else:
+        results = await asyncio.gather(
+            *(read_one(model_class, ids) for model_class, ids in requests.items())
+        )
+
+    return dict(zip(requests, results, strict=True))
@@ -4,7 +4,32 @@ Recordset class for handling collections of model records
 Recordsets represent collections of records from the same model and provide
 methods to manipulate them collectively.
 """
-from typing import Any, Dict, List, Optional, Iterator, Union
+from collections import ChainMap
+from typing import Any, Dict, List, Optional, Iterator, Union, MutableMapping
+
+
+# Sentinel for cache misses, distinct from a cached None
+_MISSING = object()
+
+
+def _merge_caches(first: MutableMapping, second: MutableMapping) -> MutableMapping:
+    """
+    Cache for a recordset combining two others, without copying
+
+    Recordsets from the same environment normally share one cache, which
+    is then reused as-is. Otherwise fields cached on both sides get a
+    ChainMap over the two per-field dicts, so lookups fall through both
+    and writes go to the first.
+    """
+    if first is second or not second:
+        return first
+    if not first:
+        return second
+    merged = dict(first)
+    for field_name, field_values in second.items():
+        own = merged.get(field_name)
+        merged[field_name] = field_values if own is None else ChainMap(own, field_values)
+    return merged
 
 
 class RecordSet:
@@ -15,6 +40,8 @@ class RecordSet:
     They support iteration, indexing, and various set operations.
     """
 
+    __slots__ = ('_model', '_ids', '_cache', '_allow_readonly_write', '_id_set_cache')
+
     def __init__(self, model, ids: Optional[List[int]] = None, cache: Optional[Dict] = None):
         """
         Initialize a RecordSet
@@ -22,12 +49,28 @@ class RecordSet:
         Args:
             model: The model class this recordset belongs to
             ids: List of record IDs in this recordset
-            cache: Optional cache dictionary for field values
+            cache: Optional cache of field values, {field_name: {id: value}}
         """
         self._model = model
         self._ids = list(ids) if ids else []
         self._cache = cache or {}
         self._allow_readonly_write = False
+        self._id_set_cache = None
+
+    def _browse_one(self, record_id: int) -> 'RecordSet':
+        """
+        Singleton recordset for one of our IDs, sharing our cache
+
+        Skips __init__, which copies the ID list and would replace an
+        empty cache with a new dict, so per-record views stay cheap.
+        """
+        record = RecordSet.__new__(RecordSet)
+        record._model = self._model
+        record._ids = [record_id]
+        record._cache = self._cache
+        record._allow_readonly_write = False
+        record._id_set_cache = None
+        return record
 
     def __len__(self) -> int:
         """Return number of records in recordset"""
@@ -39,52 +82,64 @@ class RecordSet:
 
     def __iter__(self) -> Iterator['RecordSet']:
         """Iterate over individual records as singleton recordsets"""
+        browse_one = self._browse_one
         for record_id in self._ids:
-            yield RecordSet(self._model, [record_id], self._cache)
+            yield browse_one(record_id)
 
     def __getitem__(self, index: Union[int, slice]) -> 'RecordSet':
         """Get record(s) by index"""
         if isinstance(index, slice):
             return RecordSet(self._model, self._ids[index], self._cache)
         else:
-            return RecordSet(self._model, [self._ids[index]], self._cache)
+            return self._browse_one(self._ids[index])
+
+    @property
+    def _id_set(self) -> frozenset:
+        """IDs as a frozenset, built once per recordset for membership tests"""
+        id_set = self._id_set_cache
+        if id_set is None:
+            id_set = self._id_set_cache = frozenset(self._ids)
+        return id_set
 
     def __eq__(self, other) -> bool:
         """Check if two recordsets are equal (same model and IDs)"""
-        if not isinstance(other, RecordSet):
-            return False
-        return (self._model == other._model and
-                set(self._ids) == set(other._ids))
+        if type(other) is not RecordSet:
+            return NotImplemented
+        return self._model is other._model and self._id_set == other._id_set
 
     def __add__(self, other: 'RecordSet') -> 'RecordSet':
         """Union of two recordsets (no duplicates)"""
-        if not isinstance(other, RecordSet) or self._model != other._model:
-            raise ValueError("Can only add recordsets from the same model")
+        # Other operands may implement the reflected operator
+        if type(other) is not RecordSet or self._model is not other._model:
+            return NotImplemented
         # Preserve order, no duplicates
         new_ids = self._ids.copy()
+        seen = set(new_ids)
         for record_id in other._ids:
-            if record_id not in new_ids:
+            if record_id not in seen:
+                seen.add(record_id)
                 new_ids.append(record_id)
-        return RecordSet(self._model, new_ids, {**self._cache, **other._cache})
+        return RecordSet(self._model, new_ids, _merge_caches(self._cache, other._cache))
 
     def __sub__(self, other: 'RecordSet') -> 'RecordSet':
         """Difference of two recordsets"""
-        if not isinstance(other, RecordSet) or self._model != other._model:
-            raise ValueError("Can only subtract recordsets from the same model")
-        new_ids = [rid for rid in self._ids if rid not in other._ids]
+        if type(other) is not RecordSet or self._model is not other._model:
+            return NotImplemented
+        other_ids = other._id_set
+        new_ids = [rid for rid in self._ids if rid not in other_ids]
         return RecordSet(self._model, new_ids, self._cache)
 
     def __and__(self, other: 'RecordSet') -> 'RecordSet':
         """Intersection of two recordsets"""
-        if not isinstance(other, RecordSet) or self._model != other._model:
-            raise ValueError("Can only intersect recordsets from the same model")
-        other_ids = set(other._ids)
+        if type(other) is not RecordSet or self._model is not other._model:
+            return NotImplemented
+        other_ids = other._id_set
         new_ids = [rid for rid in self._ids if rid in other_ids]
-        return RecordSet(self._model, new_ids, {**self._cache, **other._cache})
+        return RecordSet(self._model, new_ids, _merge_caches(self._cache, other._cache))
 
     def __or__(self, other: 'RecordSet') -> 'RecordSet':
         """Union of two recordsets (alias for +)"""
-        return self + other
+        return self.__add__(other)
 
     def __repr__(self) -> str:
         """String representation of recordset"""
@@ -134,10 +189,10 @@ class RecordSet:
             # Domain string - will be implemented with domain parser
             raise NotImplementedError("Domain string filtering not yet implemented")
 
-        filtered_ids = []
-        for record in self:
-            if func(record):
-                filtered_ids.append(record.id)
+        browse_one = self._browse_one
+        filtered_ids = [
+            record_id for record_id in self._ids if func(browse_one(record_id))
+        ]
 
         return RecordSet(self._model, filtered_ids, self._cache)
 
@@ -153,10 +208,11 @@ class RecordSet:
             New sorted recordset
         """
         if key is None:
-            key = lambda r: r.id
+            # Sorting by ID needs no per-record views
+            return RecordSet(self._model, sorted(self._ids, reverse=reverse), self._cache)
 
-        sorted_records = sorted(self, key=key, reverse=reverse)
-        sorted_ids = [r.id for r in sorted_records]
+        browse_one = self._browse_one
+        sorted_ids = sorted(self._ids, key=lambda rid: key(browse_one(rid)), reverse=reverse)
         return RecordSet(self._model, sorted_ids, self._cache)
 
     def mapped(self, field_name: str) -> List[Any]:
@@ -170,8 +226,12 @@ class RecordSet:
             List of field values (may contain duplicates)
         """
         result = []
-        for record in self:
-            value = getattr(record, field_name)
+        field_values = self._cache.get(field_name) or {}
+        for record_id in self._ids:
+            # Cached values are used as-is, only misses build a record
+            value = field_values.get(record_id, _MISSING)
+            if value is _MISSING:
+                value = getattr(self._browse_one(record_id), field_name)
             if isinstance(value, RecordSet):
                 result.extend(value)
             else:
@@ -185,37 +245,33 @@ class RecordSet:
         For singleton recordsets, returns the field value.
         For multi-record recordsets, returns list of values.
         """
-        if not self._ids:
+        ids = self._ids
+        if not ids:
             return None
 
-        # Check cache first
-        cache_key = (self._ids[0], field_name)
-        if cache_key in self._cache:
-            if len(self._ids) == 1:
-                return self._cache[cache_key]
+        if len(ids) == 1:
+            # Check cache first, with a single lookup per level
+            record_id = ids[0]
+            field_values = self._cache.get(field_name)
+            if field_values is not None:
+                value = field_values.get(record_id, _MISSING)
+                if value is not _MISSING:
+                    return value
 
-        # For singleton, get value from model
-        if len(self._ids) == 1:
-            return self._model._get_field_value_from_db(self._ids[0], field_name)
+            # For singleton, get value from model
+            return self._model._get_field_value_from_db(record_id, field_name)
 
         # For multi-record, return list of values
-        return [getattr(RecordSet(self._model, [rid], self._cache), field_name)
-                for rid in self._ids]
+        browse_one = self._browse_one
+        return [getattr(browse_one(rid), field_name) for rid in self._ids]
 
     def _set_field_value(self, field_name: str, value: Any):
         """Set field value for recordset"""
         if not self._ids:
             raise ValueError("Cannot set value on empty recordset")
 
-        # For singleton, update cache
-        if len(self._ids) == 1:
-            cache_key = (self._ids[0], field_name)
-            self._cache[cache_key] = value
-        else:
-            # For multi-record, set same value on all records
-            for record_id in self._ids:
-                cache_key = (record_id, field_name)
-                self._cache[cache_key] = value
+        # Set the same value on all records, looping in C
+        self._cache.setdefault(field_name, {}).update(dict.fromkeys(self._ids, value))
 
     def write(self, values: Dict[str, Any]) -> bool:
         """
@@ -4,7 +4,8 @@ Model registry for managing ORM models
 The registry maintains a global collection of all models and provides
 model lookup and lifecycle management.
 """
-from typing import Dict, Type, Optional, Any
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Type, Optional, Any
 import threading
 
 
@@ -12,29 +13,21 @@ class ModelRegistry:
     """
     Registry for managing all ORM models
 
-    The registry is a singleton that stores all model classes and provides
-    lookup functionality. Models are registered automatically via metaclass.
-    """
-
-    _instance = None
-    _lock = threading.Lock()
+    The registry stores all model classes and provides lookup
+    functionality. Models are registered automatically via metaclass into
+    the module-level ``registry`` instance; module import is thread-safe,
+    so that instance needs no locking of its own.
 
-    def __new__(cls):
-        """Ensure singleton instance"""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
+    The model mapping is copy-on-write: writers build a new dict and swap
+    it in, so readers take a single attribute load and never see a dict
+    being mutated. Published dicts must not be modified in place.
+    """
 
     def __init__(self):
         """Initialize registry"""
-        if self._initialized:
-            return
-
         self._models: Dict[str, Type] = {}
-        self._initialized = True
+        self._write_lock = threading.Lock()
+        self.version = 0  # Bumped whenever the set of model classes changes
 
     def register(self, model_name: str, model_class: Type):
         """
@@ -47,10 +40,12 @@ class ModelRegistry:
         Raises:
             ValueError: If model name is already registered
         """
-        if model_name in self._models:
-            # Allow re-registration for model inheritance/extension
-            pass
-        self._models[model_name] = model_class
+        # Re-registration is allowed for model inheritance/extension
+        with self._write_lock:
+            models = dict(self._models)
+            models[model_name] = model_class
+            self._models = models
+            self.version += 1
 
     def get(self, model_name: str) -> Optional[Type]:
         """
@@ -77,9 +72,10 @@ class ModelRegistry:
         Raises:
             KeyError: If model not found
         """
-        if model_name not in self._models:
-            raise KeyError(f"Model '{model_name}' not found in registry")
-        return self._models[model_name]
+        try:
+            return self._models[model_name]
+        except KeyError:
+            raise KeyError(f"Model '{model_name}' not found in registry") from None
 
     def __contains__(self, model_name: str) -> bool:
         """Check if model is registered"""
@@ -99,7 +95,9 @@ class ModelRegistry:
 
     def clear(self):
         """Clear all registered models (useful for testing)"""
-        self._models.clear()
+        with self._write_lock:
+            self._models = {}
+            self.version += 1
 
 
 # Global registry instance
@@ -127,6 +125,30 @@ class Environment:
         self.user = user
         self.context = context or {}
         self._cache = {}
+        self._access = None
+
+    @property
+    def access(self):
+        """
+        Access controller for this environment
+
+        Built on first use and shared by every security check made through
+        the environment; rebuilt only if the user or context is replaced.
+
+        Returns:
+            AccessController bound to this environment
+        """
+        access = self._access
+        if access is None or access.user is not self.user or access.context is not self.context:
+            # Lazy import: security imports the ORM registry
+            from openflow.server.core.security.access_control import AccessController
+            access = self._access = AccessController(self)
+        return access
+
+    @property
+    def registry(self) -> ModelRegistry:
+        """Model registry backing this environment"""
+        return registry
 
     def __getitem__(self, model_name: str):
         """
@@ -138,9 +160,14 @@ class Environment:
         Returns:
             Model class bound to this environment
         """
-        model_class = registry[model_name]
-        # Return model bound to this environment
-        return model_class.with_env(self)
+        # Bound models are kept in the environment cache until invalidated
+        bound = self._cache.get(model_name)
+        if bound is not None:
+            return bound
+
+        bound = registry[model_name].with_env(self)
+        self._cache[model_name] = bound
+        return bound
 
     def ref(self, xml_id: str):
         """
@@ -159,6 +186,28 @@ class Environment:
         """Invalidate all cached values"""
         self._cache.clear()
 
+    @asynccontextmanager
+    async def _acquire(self) -> AsyncIterator[Any]:
+        """
+        Session for a batch of ORM statements
+
+        Yields the environment's own session when it has one. Otherwise a
+        session is borrowed from the pooled engine for the duration of the
+        block, so its connection is returned to the pool instead of being
+        set up per statement.
+
+        Yields:
+            Database session
+        """
+        if self.session is not None:
+            yield self.session
+            return
+
+        # Lazy import: the engine is built from settings on first use
+        from openflow.server.core.database import AsyncSessionLocal
+        async with AsyncSessionLocal() as session:
+            yield session
+
 
 def get_env(session=None, user=None, context=None) -> Environment:
     """
@@ -33,6 +33,14 @@ class AccessController:
         self.user = env.user
         self.context = env.context
 
+        # The user is fixed for the controller's lifetime: the superuser
+        # flag guarding every check is computed up front, the groups on
+        # first use
+        self._superuser = bool(
+            self.user and getattr(self.user, 'id', None) == SUPERUSER_ID
+        )
+        self._user_groups_cache: Optional[List[int]] = None
+
     def is_superuser(self) -> bool:
         """Check if the current user is a superuser.
 
@@ -41,9 +49,7 @@ class AccessController:
         Returns:
             True if user is superuser
         """
-        if not self.user:
-            return False
-        return getattr(self.user, 'id', None) == SUPERUSER_ID
+        return self._superuser
 
     def check_model_access(
         self,
@@ -74,7 +80,7 @@ class AccessController:
             False  # or raises AccessDenied
         """
         # Superuser bypasses all checks
-        if self.is_superuser():
+        if self._superuser:
             return True
 
         # If no user, deny access
@@ -105,6 +111,17 @@ class AccessController:
     def _get_user_groups(self) -> List[int]:
         """Get list of group IDs for the current user.
 
+        Returns:
+            List of group IDs
+        """
+        user_groups = self._user_groups_cache
+        if user_groups is None:
+            user_groups = self._user_groups_cache = self._compute_user_groups()
+        return user_groups
+
+    def _compute_user_groups(self) -> List[int]:
+        """Read the current user's group IDs.
+
         Returns:
             List of group IDs
         """
@@ -175,7 +192,7 @@ class AccessController:
             >>> # Returns: [{'domain_force': [('user_id', '=', user.id)], ...}]
         """
         # Superuser bypasses rules
-        if self.is_superuser():
+        if self._superuser:
             return []
 
         # Get user's groups
@@ -218,24 +235,24 @@ class AccessController:
             >>> # Result: ['&', ('active', '=', True), ('user_id', '=', user.id)]
         """
         # Superuser bypasses rules
-        if self.is_superuser():
+        if self._superuser:
             return domain or []
 
         rules = self.get_record_rules(model_name, operation)
         if not rules:
             return domain or []
 
-        # Combine domain with rule domains using AND logic
-        combined = list(domain) if domain else []
+        # Combine domain with rule domains using AND logic: one '&' per
+        # rule joined onto a non-empty domain, all prefixed in a single list
+        rule_domains = [rule['domain_force'] for rule in rules if rule.get('domain_force')]
+        if not rule_domains:
+            return list(domain) if domain else []
 
-        for rule in rules:
-            rule_domain = rule.get('domain_force', [])
-            if rule_domain:
-                if combined:
-                    # AND the rule domain with existing domain
-                    combined = ['&'] + combined + rule_domain
-                else:
-                    combined = rule_domain
+        combined = ['&'] * (len(rule_domains) if domain else len(rule_domains) - 1)
+        if domain:
+            combined.extend(domain)
+        for rule_domain in rule_domains:
+            combined.extend(rule_domain)
 
         return combined
 
@@ -262,7 +279,7 @@ class AccessController:
             >>> # Returns: ['name', 'email'] (password and salary hidden)
         """
         # Superuser sees all fields
-        if self.is_superuser():
+        if self._superuser:
             return field_names
 
         # Get model class from registry
@@ -296,7 +313,7 @@ class AccessController:
             True if user can access the field
         """
         # Superuser can access all fields
-        if self.is_superuser():
+        if self._superuser:
             return True
 
         # Get model class from registry
@@ -347,7 +364,7 @@ class AccessController:
             >>> # Returns: [1, 3, 5] (user's allowed companies)
         """
         # Superuser can access all companies
-        if self.is_superuser():
+        if self._superuser:
             # TODO: Return all company IDs
             return []
 
@@ -392,7 +409,7 @@ class AccessController:
             >>> #           ('company_id', 'in', [1, 3])]
         """
         # Superuser bypasses company filtering
-        if self.is_superuser():
+        if self._superuser:
             return domain or []
 
         allowed_companies = self.get_allowed_companies()
@@ -400,8 +417,8 @@ class AccessController:
             return domain or []
 
         # Add company filter
-        company_filter = [('company_id', 'in', allowed_companies)]
+        company_leaf = ('company_id', 'in', allowed_companies)
 
         if domain:
-            return ['&'] + list(domain) + company_filter
-        return company_filter
+            return ['&', *domain, company_leaf]
+        return [company_leaf]
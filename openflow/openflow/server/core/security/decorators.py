@@ -4,15 +4,21 @@ This module provides decorators to protect methods and controllers
 with authentication and authorization checks.
 """
 
+import threading
+import time
+from collections import defaultdict, deque
 from functools import wraps
 from typing import Callable, Optional, List, Literal, Union
-from .access_control import AccessController, OperationType
+from .access_control import OperationType
 from .exceptions import (
     AccessDenied,
     AuthenticationError,
     InsufficientPermissions
 )
 
+# Number of independently locked partitions of each rate_limit's call log
+RATE_LIMIT_SHARDS = 64
+
 
 def require_login(func: Callable) -> Callable:
     """Decorator to require user authentication.
@@ -89,17 +95,14 @@ def check_access(
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            # Determine model name
-            model_name = model
-            if not model_name and hasattr(self, '_name'):
-                model_name = self._name
+            # Determine model name; an explicit model is fixed at decoration
+            model_name = model or getattr(self, '_name', None)
             if not model_name:
                 raise ValueError("Cannot determine model name for access check")
 
             # Check access
             if hasattr(self, 'env'):
-                controller = AccessController(self.env)
-                controller.check_model_access(
+                self.env.access.check_model_access(
                     model_name,
                     operation,
                     raise_exception=raise_exception
@@ -135,7 +138,7 @@ def require_groups(groups: Union[str, List[str]]) -> Callable:
         ...         # User must be in both groups
         ...         pass
     """
-    group_list = [groups] if isinstance(groups, str) else groups
+    group_tuple = (groups,) if isinstance(groups, str) else tuple(groups)
 
     def decorator(func: Callable) -> Callable:
         @wraps(func)
@@ -146,7 +149,7 @@ def require_groups(groups: Union[str, List[str]]) -> Callable:
             user = self.env.user
 
             # Check if user is in all required groups
-            for group_ext_id in group_list:
+            for group_ext_id in group_tuple:
                 if not user.has_group(group_ext_id):
                     raise InsufficientPermissions(
                         f"User must be in group: {group_ext_id}"
@@ -229,8 +232,7 @@ def superuser_only(func: Callable) -> Callable:
         if not hasattr(self, 'env'):
             raise AuthenticationError("No environment context")
 
-        controller = AccessController(self.env)
-        if not controller.is_superuser():
+        if not self.env.access.is_superuser():
             raise AccessDenied("This operation requires superuser privileges")
 
         return func(self, *args, **kwargs)
@@ -296,41 +298,43 @@ def rate_limit(max_calls: int, period_seconds: int) -> Callable:
         ...         # Limited to 5 calls per minute
         ...         pass
     """
-    # Simple in-memory rate limiting
-    call_times = {}
+    # Simple in-memory rate limiting: per key, monotonic call timestamps
+    # oldest first, so expired entries are popped from the left. Keys are
+    # spread over locked shards so callers with different keys rarely
+    # contend while check-and-record stays atomic per key.
+    shards = [(threading.Lock(), defaultdict(deque)) for _ in range(RATE_LIMIT_SHARDS)]
 
     def decorator(func: Callable) -> Callable:
+        func_name = func.__name__
+
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            from datetime import datetime, timedelta
-
             # Get user ID for rate limiting
             user_id = None
             if hasattr(self, 'env') and self.env.user:
                 user_id = getattr(self.env.user, 'id', None)
 
             if user_id:
-                key = f"{func.__name__}:{user_id}"
-                now = datetime.utcnow()
-
-                # Clean old entries
-                if key in call_times:
-                    call_times[key] = [
-                        t for t in call_times[key]
-                        if now - t < timedelta(seconds=period_seconds)
-                    ]
-
-                # Check rate limit
-                if key not in call_times:
-                    call_times[key] = []
-
-                if len(call_times[key]) >= max_calls:
-                    raise AccessDenied(
-                        f"Rate limit exceeded: {max_calls} calls per "
-                        f"{period_seconds} seconds"
-                    )
-
-                call_times[key].append(now)
+                key = f"{func_name}:{user_id}"
+                lock, call_times = shards[hash(key) % RATE_LIMIT_SHARDS]
+
+                with lock:
+                    now = time.monotonic()
+
+                    # Clean old entries
+                    calls = call_times[key]
+                    cutoff = now - period_seconds
+                    while calls and calls[0] <= cutoff:
+                        calls.popleft()
+
+                    # Check rate limit
+                    if len(calls) >= max_calls:
+                        raise AccessDenied(
+                            f"Rate limit exceeded: {max_calls} calls per "
+                            f"{period_seconds} seconds"
+                        )
+
+                    calls.append(now)
 
             return func(self, *args, **kwargs)
 
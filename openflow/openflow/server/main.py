@@ -5,6 +5,7 @@ from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import JSONResponse, FileResponse
 import logging
@@ -93,6 +94,13 @@ app.add_middleware(
     allow_headers=settings.cors_allow_headers,
 )
 
+# Compress large responses (e.g. search_read results) for clients that accept gzip
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=settings.gzip_minimum_size,
+    compresslevel=settings.gzip_compress_level,
+)
+
 
 # Root endpoint
 @app.get("/")
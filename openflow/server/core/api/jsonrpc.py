@@ -3,17 +3,28 @@ JSON-RPC 2.0 Endpoint
 Provides standard JSON-RPC interface for model operations
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import functools
+import inspect
+from typing import Any, Callable, Dict, List, Optional
 from fastapi import APIRouter, Depends, Request, Response
 from pydantic import BaseModel, Field
+from sqlalchemy.exc import SQLAlchemyError
 
-from openflow.server.core.orm.registry import Environment
+from openflow.server.config.settings import settings
+from openflow.server.core.database import AsyncSessionLocal
+from openflow.server.core.orm.models import Model
+from openflow.server.core.orm.recordset import RecordSet
+from openflow.server.core.orm.registry import Environment, get_env, registry
 from .dependencies import get_env_with_user, get_env_optional_auth
 from .exceptions import ValidationError, NotFoundError, InternalServerError
-from .serializers import serialize_recordset, serialize_record
+from .serializers import serialize_recordset, serialize_value
 
 router = APIRouter(prefix="/jsonrpc", tags=["JSON-RPC"])
 
+# Methods whose RecordSet result is serialized as a list of records
+RECORDSET_METHODS = frozenset({'search', 'browse', 'create'})
+
 
 class JSONRPCRequest(BaseModel):
     """JSON-RPC 2.0 Request"""
@@ -43,23 +54,53 @@ def create_error_response(
     code: int,
     message: str,
     data: Optional[Dict[str, Any]] = None,
-) -> JSONRPCResponse:
-    """Create JSON-RPC error response"""
-    return JSONRPCResponse(
-        id=request_id,
-        error=JSONRPCError(code=code, message=message, data=data)
-    )
+) -> Dict[str, Any]:
+    """
+    Create JSON-RPC error response
+
+    Built as a plain dict: the shape is fixed and server-generated, so
+    running it through JSONRPCResponse validation would only add cost.
+    """
+    return {
+        'jsonrpc': '2.0',
+        'error': {'code': code, 'message': message, 'data': data},
+        'id': request_id,
+    }
 
 
 def create_success_response(
     request_id: Optional[int | str],
     result: Any,
-) -> JSONRPCResponse:
+) -> Dict[str, Any]:
     """Create JSON-RPC success response"""
-    return JSONRPCResponse(
-        id=request_id,
-        result=result,
-    )
+    return {
+        'jsonrpc': '2.0',
+        'result': result,
+        'id': request_id,
+    }
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve(registry_version: int, model: str, method: str) -> Callable:
+    """
+    Resolve a model method to its class-level descriptor
+
+    Memoized per registry version so re-registered models invalidate the
+    cache. The descriptor is bound to the environment's model at call time.
+
+    Raises:
+        NotFoundError: If the model is not registered
+        ValidationError: If the model has no such method
+    """
+    model_class = registry.get(model)
+    if model_class is None:
+        raise NotFoundError(f"Model '{model}' not found")
+
+    descriptor = inspect.getattr_static(model_class, method, None)
+    if not hasattr(descriptor, '__get__'):
+        raise ValidationError(f"Method '{method}' not found on model '{model}'")
+
+    return descriptor
 
 
 async def execute_call_kw(
@@ -82,38 +123,22 @@ async def execute_call_kw(
     Returns:
         Method result
     """
-    if model not in env.registry.models:
-        raise NotFoundError(f"Model '{model}' not found")
-
+    descriptor = _resolve(env.registry.version, model, method)
     model_class = env[model]
-
-    # Check if method exists
-    if not hasattr(model_class, method):
-        raise ValidationError(f"Method '{method}' not found on model '{model}'")
-
-    # Get the method
-    method_func = getattr(model_class, method)
+    method_func = descriptor.__get__(model_class, type(model_class))
 
     # Call the method
-    try:
-        result = await method_func(*args, **kwargs)
-
-        # Serialize RecordSets
-        if hasattr(result, '__class__') and hasattr(result.__class__, '_name'):
-            # It's a RecordSet
-            if method in ['search', 'browse', 'create']:
-                fields = kwargs.get('fields')
-                return serialize_recordset(result, fields=fields)
-            else:
-                return serialize_value(result)
+    result = await method_func(*args, **kwargs)
 
-        return result
+    # Serialize RecordSets
+    if isinstance(result, (RecordSet, Model)):
+        if method in RECORDSET_METHODS:
+            fields = kwargs.get('fields')
+            return serialize_recordset(result, fields=fields)
+        else:
+            return serialize_value(result)
 
-    except Exception as e:
-        raise InternalServerError(
-            f"Error executing {model}.{method}: {str(e)}",
-            details={'model': model, 'method': method}
-        )
+    return result
 
 
 async def execute_crud_operation(
@@ -145,7 +170,7 @@ async def execute_crud_operation(
     Returns:
         Operation result
     """
-    if model not in env.registry.models:
+    if model not in env.registry:
         raise NotFoundError(f"Model '{model}' not found")
 
     model_class = env[model]
@@ -157,8 +182,7 @@ async def execute_crud_operation(
             offset = kwargs.get('offset', 0)
             order = kwargs.get('order')
 
-            result = await model_class.search(domain, limit=limit, offset=offset, order=order)
-            return [rec.id for rec in result]
+            return await model_class.search_ids(domain, limit=limit, offset=offset, order=order)
 
         elif operation == 'search_read':
             domain = args[0] if args else []
@@ -167,8 +191,13 @@ async def execute_crud_operation(
             offset = kwargs.get('offset', 0)
             order = kwargs.get('order')
 
-            records = await model_class.search(domain, limit=limit, offset=offset, order=order)
-            return serialize_recordset(records, fields=fields)
+            rows = await model_class.search_read(
+                domain, fields=fields, limit=limit, offset=offset, order=order
+            )
+            return [
+                {name: serialize_value(value) for name, value in row.items()}
+                for row in rows
+            ]
 
         elif operation == 'read':
             ids = args[0] if args else []
@@ -183,14 +212,13 @@ async def execute_crud_operation(
         elif operation == 'create':
             values = args[0] if args else kwargs.get('values', {})
 
-            if isinstance(values, list):
-                # Batch create
-                records = await model_class.create(values)
-                return serialize_recordset(records)
-            else:
-                # Single create
-                record = await model_class.create(values)
-                return serialize_record(record)
+            # Single and batch create share one path; only the reply shape differs
+            is_batch = isinstance(values, list)
+            records = await model_class.create(values if is_batch else [values])
+            serialized = serialize_recordset(records)
+            if is_batch:
+                return serialized
+            return serialized[0] if serialized else {}
 
         elif operation == 'write':
             ids = args[0] if args else []
@@ -215,32 +243,23 @@ async def execute_crud_operation(
 
         elif operation == 'search_count':
             domain = args[0] if args else []
-            result = await model_class.search(domain)
-            return len(result)
+            return await model_class.search_count(domain)
 
         else:
             raise ValidationError(f"Unknown operation: {operation}")
 
-    except Exception as e:
-        if isinstance(e, ValidationError):
-            raise
+    except SQLAlchemyError as e:
         raise InternalServerError(
             f"Error executing {operation} on {model}: {str(e)}",
             details={'model': model, 'operation': operation}
-        )
+        ) from e
 
 
-def serialize_value(value: Any) -> Any:
-    """Serialize complex values for JSON-RPC response"""
-    from .serializers import serialize_value as _serialize_value
-    return _serialize_value(value)
-
-
-@router.post("", response_model=JSONRPCResponse)
+@router.post("", response_model=None, responses={200: {'model': JSONRPCResponse}})
 async def jsonrpc_endpoint(
     request: JSONRPCRequest,
     env: Environment = Depends(get_env_with_user),
-) -> JSONRPCResponse:
+) -> Dict[str, Any]:
     """
     JSON-RPC 2.0 Endpoint
 
@@ -327,30 +346,58 @@ async def jsonrpc_endpoint(
         )
 
 
-@router.post("/batch", response_model=List[JSONRPCResponse])
+async def _dispatch_jsonrpc(
+    request: JSONRPCRequest,
+    env: Environment,
+    semaphore: asyncio.Semaphore,
+) -> Dict[str, Any]:
+    """
+    Dispatch a single batch item
+
+    AsyncSession does not support concurrent use, so each item runs on its
+    own session with an environment cloned from the caller's user and context.
+    """
+    async with semaphore:
+        async with AsyncSessionLocal() as session:
+            item_env = get_env(session=session, user=env.user, context=env.context)
+            # jsonrpc_endpoint reports failures as error responses rather
+            # than raising, so a failed item's partial writes are undone here
+            response = await jsonrpc_endpoint(request, item_env)
+            if 'error' in response:
+                await session.rollback()
+            else:
+                await session.commit()
+            return response
+
+
+@router.post("/batch", response_model=None, responses={200: {'model': List[JSONRPCResponse]}})
 async def jsonrpc_batch_endpoint(
     requests: List[JSONRPCRequest],
     env: Environment = Depends(get_env_with_user),
-) -> List[JSONRPCResponse]:
+) -> List[Dict[str, Any]]:
     """
     JSON-RPC 2.0 Batch Endpoint
     Processes multiple JSON-RPC requests in a single HTTP request
+
+    Items are dispatched concurrently, bounded by the database pool size
+    so a large batch cannot exhaust the connection pool.
     """
-    responses = []
-
-    for req in requests:
-        try:
-            # Process each request
-            response = await jsonrpc_endpoint(req, env)
-            responses.append(response)
-        except Exception as e:
-            responses.append(
-                create_error_response(
-                    req.id if hasattr(req, 'id') else None,
-                    -32603,
-                    f"Internal error: {str(e)}"
-                )
+    semaphore = asyncio.Semaphore(settings.get_db_pool_size())
+    responses = await asyncio.gather(
+        *(_dispatch_jsonrpc(req, env, semaphore) for req in requests),
+        return_exceptions=True,
+    )
+
+    # gather() already returns one slot per request; fill failures in place
+    for i, result in enumerate(responses):
+        if isinstance(result, Exception):
+            responses[i] = create_error_response(
+                requests[i].id,
+                -32603,
+                f"Internal error: {str(result)}"
             )
+        elif isinstance(result, BaseException):
+            raise result
 
     return responses
 
@@ -3,7 +3,7 @@ Record Serialization
 Converts ORM records to JSON-compatible dictionaries
 """
 
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from datetime import date, datetime
 from decimal import Decimal
 
@@ -48,37 +48,29 @@ def serialize_value(value: Any) -> Any:
     return value
 
 
-def serialize_record(
-    record: Any,
-    fields: Optional[List[str]] = None,
-    include_metadata: bool = False,
-) -> Dict[str, Any]:
+def _resolve_fields(record: Any, fields: Optional[Iterable[str]]) -> Tuple[str, ...]:
     """
-    Serialize a single record to dictionary
+    Resolve the field names to serialize for a record's model
 
-    Args:
-        record: ORM record to serialize
-        fields: List of field names to include (None = all fields)
-        include_metadata: Include _metadata with field types
-
-    Returns:
-        Dictionary with field values
+    Unknown names are dropped here so the per-record loop does not have
+    to check them again.
     """
-    if not record:
-        return {}
+    model_fields = record._fields
+    if fields is None:
+        return tuple(model_fields)
+    return tuple(name for name in fields if name in model_fields)
 
-    result = {}
 
-    # Get fields to serialize
-    if fields is None:
-        # Get all fields from the model
-        fields = list(record._fields.keys())
+def _serialize_fields(
+    record: Any,
+    field_names: Tuple[str, ...],
+    include_metadata: bool,
+) -> Dict[str, Any]:
+    """Serialize already-resolved fields of a single record"""
+    result = {}
 
     # Serialize each field
-    for field_name in fields:
-        if field_name not in record._fields:
-            continue
-
+    for field_name in field_names:
         try:
             value = getattr(record, field_name, None)
             result[field_name] = serialize_value(value)
@@ -96,17 +88,42 @@ def serialize_record(
     return result
 
 
+def serialize_record(
+    record: Any,
+    fields: Optional[Iterable[str]] = None,
+    include_metadata: bool = False,
+) -> Dict[str, Any]:
+    """
+    Serialize a single record to dictionary
+
+    Args:
+        record: ORM record to serialize
+        fields: Field names to include (None = all fields)
+        include_metadata: Include _metadata with field types
+
+    Returns:
+        Dictionary with field values
+    """
+    if not record:
+        return {}
+
+    return _serialize_fields(record, _resolve_fields(record, fields), include_metadata)
+
+
 def serialize_recordset(
     records: Any,
-    fields: Optional[List[str]] = None,
+    fields: Optional[Iterable[str]] = None,
     include_metadata: bool = False,
 ) -> List[Dict[str, Any]]:
     """
     Serialize a recordset to list of dictionaries
 
+    The requested fields are resolved once against the model and reused
+    for every record.
+
     Args:
         records: ORM recordset to serialize
-        fields: List of field names to include (None = all fields)
+        fields: Field names to include (None = all fields)
         include_metadata: Include _metadata with field types
 
     Returns:
@@ -115,10 +132,14 @@ def serialize_recordset(
     if not records:
         return []
 
-    return [
-        serialize_record(record, fields=fields, include_metadata=include_metadata)
-        for record in records
-    ]
+    field_names = None
+    result = []
+    for record in records:
+        if field_names is None:
+            field_names = _resolve_fields(record, fields)
+        result.append(_serialize_fields(record, field_names, include_metadata))
+
+    return result
 
 
 def format_success_response(
@@ -0,0 +1,15 @@
+"""
+Shared test fixtures
+"""
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def manifest_cache_dir(tmp_path, monkeypatch):
+    """Keep the manifest disk cache inside the test's temporary directory"""
+    from openflow.server.core.modules import module as module_mod
+
+    cache_dir = tmp_path / 'manifest-cache'
+    monkeypatch.setattr(module_mod, 'MANIFEST_CACHE_DIR', cache_dir)
+    monkeypatch.setattr(module_mod, '_manifest_cache', {})
+    return cache_dir
@@ -119,6 +119,60 @@ class TestJSONRPC:
             assert len(data) == 2
 
 
+class TestJSONRPCBatchDispatch:
+    """Test per-item transactions of JSON-RPC batches"""
+
+    async def test_failed_item_rolled_back(self, monkeypatch):
+        """Test a failing item is rolled back while the others commit"""
+        import asyncio
+        from openflow.server.core.api import jsonrpc
+        from openflow.server.core.orm.registry import get_env
+
+        class FakeSession:
+            def __init__(self):
+                self.outcome = None
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc_info):
+                return False
+
+            async def commit(self):
+                self.outcome = 'commit'
+
+            async def rollback(self):
+                self.outcome = 'rollback'
+
+        sessions = []
+
+        def session_factory():
+            session = FakeSession()
+            sessions.append(session)
+            return session
+
+        async def fake_endpoint(request, env):
+            if request.method == 'fail':
+                return jsonrpc.create_error_response(request.id, -32603, 'boom')
+            return jsonrpc.create_success_response(request.id, True)
+
+        monkeypatch.setattr(jsonrpc, 'AsyncSessionLocal', session_factory)
+        monkeypatch.setattr(jsonrpc, 'jsonrpc_endpoint', fake_endpoint)
+
+        semaphore = asyncio.Semaphore(2)
+        env = get_env()
+        responses = [
+            await jsonrpc._dispatch_jsonrpc(
+                jsonrpc.JSONRPCRequest(method=method, id=i), env, semaphore
+            )
+            for i, method in enumerate(['call', 'fail', 'call'])
+        ]
+
+        assert [session.outcome for session in sessions] == ['commit', 'rollback', 'commit']
+        assert 'result' in responses[0] and 'result' in responses[2]
+        assert responses[1]['error']['message'] == 'boom'
+
+
 class TestRESTAPI:
     """Test REST API endpoints"""
 
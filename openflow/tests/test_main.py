@@ -37,3 +37,17 @@ def test_404_handler(client):
     assert response.status_code == 404
     data = response.json()
     assert "detail" in data
+
+
+def test_gzip_compression(client):
+    """Test large responses are gzip-compressed when accepted"""
+    response = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers.get("content-encoding") == "gzip"
+
+
+def test_small_response_not_compressed(client):
+    """Test small responses are sent uncompressed"""
+    response = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
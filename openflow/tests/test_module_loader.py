@@ -48,6 +48,140 @@ class TestModuleManifest:
         assert data['depends'] == ['base', 'web']
 
 
+    def test_manifest_defaults_are_shared_tuples(self):
+        """Test list fields default to empty tuples and export as lists"""
+        manifest = ModuleManifest(name='Empty')
+
+        assert manifest.depends == ()
+        assert manifest.data == ()
+        assert manifest.to_dict()['depends'] == []
+
+    def test_manifest_parse_is_cached(self, tmp_path, monkeypatch, manifest_cache_dir):
+        """Test parsed manifests are served from the on-disk cache"""
+        from openflow.server.core.modules import module as module_mod
+
+        cache_dir = manifest_cache_dir
+
+        manifest_file = tmp_path / '__manifest__.py'
+        manifest_file.write_text("{'name': 'Cached', 'depends': ['base']}")
+
+        data = Module._parse_manifest(manifest_file)
+        assert data == {'name': 'Cached', 'depends': ['base']}
+        assert len(list(cache_dir.glob('*.pkl'))) == 1
+
+        # A fresh process reads the cache file instead of re-parsing
+        monkeypatch.setattr(module_mod, '_manifest_cache', {})
+        monkeypatch.setattr(
+            Module, '_parse_manifest_source',
+            staticmethod(lambda path: pytest.fail("manifest was re-parsed")),
+        )
+        data['depends'].append('web')
+        assert Module._parse_manifest(manifest_file) == data | {'depends': ['base']}
+
+        # Editing the manifest invalidates the cache file in place
+        monkeypatch.undo()
+        monkeypatch.setattr(module_mod, 'MANIFEST_CACHE_DIR', cache_dir)
+        monkeypatch.setattr(module_mod, '_manifest_cache', {})
+        manifest_file.write_text("{'name': 'Edited', 'depends': []}")
+        assert Module._parse_manifest(manifest_file)['name'] == 'Edited'
+        assert len(list(cache_dir.glob('*.pkl'))) == 1
+
+    def test_manifest_cache_corrupt_entry(self, tmp_path, manifest_cache_dir):
+        """Test unreadable or non-dict cache entries fall back to parsing"""
+        import pickle
+        from openflow.server.core.modules import module as module_mod
+
+        manifest_file = tmp_path / '__manifest__.py'
+        manifest_file.write_text("{'name': 'Source'}")
+        stat = manifest_file.stat()
+        key = (str(manifest_file.resolve()), stat.st_mtime_ns, stat.st_size)
+        header = module_mod._manifest_cache_header(key)
+        manifest_cache_dir.mkdir()
+        cache_file = module_mod._manifest_cache_file(manifest_cache_dir, key)
+
+        # Unknown global (AttributeError), truncated data, wrong type
+        payloads = [
+            b'cbuiltins\nno_such_name\n.',
+            pickle.dumps({'name': 'Cached'})[:-3],
+            pickle.dumps(['not', 'a', 'dict']),
+        ]
+        for payload in payloads:
+            cache_file.write_bytes(header + payload)
+            module_mod._manifest_cache.clear()
+            assert Module._parse_manifest(manifest_file) == {'name': 'Source'}
+
+    def test_manifest_disk_cache_off_by_default(self, tmp_path, monkeypatch):
+        """Test no cache files are written when no cache directory is set"""
+        from openflow.server.core.modules import module as module_mod
+
+        monkeypatch.setattr(module_mod, 'MANIFEST_CACHE_DIR', None)
+        manifest_file = tmp_path / '__manifest__.py'
+        manifest_file.write_text("{'name': 'Uncached'}")
+
+        assert Module._parse_manifest(manifest_file) == {'name': 'Uncached'}
+        assert [p.name for p in tmp_path.iterdir()] == ['__manifest__.py']
+
+    def test_manifest_disk_cache_unwritable(self, tmp_path, monkeypatch):
+        """Test an unwritable cache directory turns the disk cache off"""
+        from openflow.server.core.modules import module as module_mod
+
+        blocker = tmp_path / 'blocker'
+        blocker.write_text('a file, not a directory')
+        cache_dir = blocker / 'cache'
+        monkeypatch.setattr(module_mod, 'MANIFEST_CACHE_DIR', cache_dir)
+        monkeypatch.setattr(module_mod, '_unwritable_cache_dirs', set())
+        manifest_file = tmp_path / '__manifest__.py'
+        manifest_file.write_text("{'name': 'Unwritable'}")
+
+        assert Module._parse_manifest(manifest_file) == {'name': 'Unwritable'}
+        assert module_mod._manifest_cache_dir() is None
+
+    def test_manifest_cache_prunes_other_formats(self, tmp_path, manifest_cache_dir):
+        """Test entries from an older cache format are removed"""
+        manifest_cache_dir.mkdir()
+        stale = manifest_cache_dir / 'stale.json'
+        stale.write_text('{}')
+        manifest_file = tmp_path / '__manifest__.py'
+        manifest_file.write_text("{'name': 'Fresh'}")
+
+        Module._parse_manifest(manifest_file)
+        assert not stale.exists()
+        assert len(list(manifest_cache_dir.glob('*.pkl'))) == 1
+
+
+    def test_manifest_parse_formats(self, tmp_path):
+        """Test parsing dict literal, BOM-prefixed and assignment manifests"""
+        manifest_file = tmp_path / '__manifest__.py'
+
+        manifest_file.write_text("# comment\n{'name': 'Plain'}", encoding='utf-8-sig')
+        assert Module._parse_manifest_source(manifest_file) == {'name': 'Plain'}
+
+        manifest_file.write_text("manifest = {'name': 'Legacy'}")
+        assert Module._parse_manifest_source(manifest_file) == {'name': 'Legacy'}
+
+        manifest_file.write_text("x = 1")
+        with pytest.raises(ValueError):
+            Module._parse_manifest_source(manifest_file)
+
+
+    def test_module_subdirectory_paths(self, tmp_path):
+        """Test module subdirectory paths come from a single directory scan"""
+        (tmp_path / 'models').mkdir()
+        (tmp_path / 'views').mkdir()
+        (tmp_path / 'data').write_text('not a directory')
+
+        module = Module(
+            name='test',
+            path=tmp_path,
+            manifest=ModuleManifest(name='Test'),
+        )
+
+        assert module.models_path == tmp_path / 'models'
+        assert module.views_path == tmp_path / 'views'
+        assert module.data_path is None
+        assert module.static_path is None
+
+
 class TestModuleGraph:
     """Tests for ModuleGraph and dependency resolution"""
 
@@ -131,7 +265,7 @@ class TestModuleGraph:
         graph.add_module(b)
         graph.add_module(c)
 
-        with pytest.raises(CircularDependencyError):
+        with pytest.raises(CircularDependencyError, match='a -> b -> c -> a'):
             graph.topological_sort()
 
     def test_missing_dependency_detection(self):
@@ -150,6 +284,35 @@ class TestModuleGraph:
         with pytest.raises(MissingDependencyError):
             graph.topological_sort()
 
+    def test_dependency_added_after_dependent(self):
+        """Test a dependency added after its dependent is not reported missing"""
+        graph = ModuleGraph()
+
+        graph.add_module(Module(
+            name='web',
+            path=Path('/tmp/web'),
+            manifest=ModuleManifest(name='Web', depends=['base']),
+        ))
+        graph.add_module(Module(
+            name='base',
+            path=Path('/tmp/base'),
+            manifest=ModuleManifest(name='Base', depends=[]),
+        ))
+
+        assert graph.topological_sort() == ['base', 'web']
+
+    def test_topological_sort_priority(self):
+        """Test ready modules are ordered auto_install first, then by name"""
+        graph = ModuleGraph()
+        for name, auto_install in [('zeta', False), ('alpha', False), ('mail', True)]:
+            graph.add_module(Module(
+                name=name,
+                path=Path(f'/tmp/{name}'),
+                manifest=ModuleManifest(name=name, auto_install=auto_install),
+            ))
+
+        assert graph.topological_sort() == ['mail', 'alpha', 'zeta']
+
     def test_dependency_chain(self):
         """Test getting dependency chain for a module"""
         graph = ModuleGraph()
@@ -196,6 +359,38 @@ class TestModuleGraph:
         assert chain.index('portal') < chain.index('sale')
 
 
+    def test_dependency_chain_cache_invalidation(self):
+        """Test cached dependency chains are dropped when the graph changes"""
+        graph = ModuleGraph()
+        graph.add_module(Module(
+            name='base',
+            path=Path('/tmp/base'),
+            manifest=ModuleManifest(name='Base', depends=[]),
+        ))
+        graph.add_module(Module(
+            name='web',
+            path=Path('/tmp/web'),
+            manifest=ModuleManifest(name='Web', depends=['base']),
+        ))
+
+        chain = graph.get_dependency_chain('web')
+        chain.append('mutated')
+        assert graph.get_dependency_chain('web') == ['base', 'web']
+
+        # Re-adding web with a new dependency must not serve the stale chain
+        graph.add_module(Module(
+            name='mail',
+            path=Path('/tmp/mail'),
+            manifest=ModuleManifest(name='Mail', depends=['base']),
+        ))
+        graph.add_module(Module(
+            name='web',
+            path=Path('/tmp/web'),
+            manifest=ModuleManifest(name='Web', depends=['mail']),
+        ))
+        assert graph.get_dependency_chain('web') == ['base', 'mail', 'web']
+
+
 class TestModuleLoader:
     """Tests for ModuleLoader"""
 
@@ -250,6 +445,51 @@ class TestModuleLoader:
             assert load_order[0] == 'base'
 
 
+class TestLoadOrder:
+    """Tests for ModuleLoader.get_load_order with a module subset"""
+
+    def _loader(self, depends):
+        loader = ModuleLoader()
+        for name, deps in depends.items():
+            loader.modules[name] = Module(
+                name=name,
+                path=Path(f'/tmp/{name}'),
+                manifest=ModuleManifest(name=name.title(), depends=deps),
+            )
+        loader.build_dependency_graph()
+        return loader
+
+    def test_load_order_subset(self):
+        """Test load order contains requested modules and their dependencies"""
+        loader = self._loader({
+            'base': [], 'web': ['base'], 'mail': ['base'],
+            'sale': ['web', 'mail'], 'stock': ['base'],
+        })
+
+        order = loader.get_load_order(['sale'])
+
+        assert set(order) == {'base', 'web', 'mail', 'sale'}
+        assert order.index('base') < order.index('web') < order.index('sale')
+        assert order.index('mail') < order.index('sale')
+
+    def test_load_order_subset_follows_root_order(self):
+        """Test cached orders are not shared between root orders"""
+        loader = self._loader({'base': [], 'web': ['base'], 'mail': ['base']})
+
+        assert loader.get_load_order(['web', 'mail']) == ['base', 'web', 'mail']
+        assert loader.get_load_order(['mail', 'web']) == ['base', 'mail', 'web']
+        assert loader.get_load_order(['web', 'mail']) == ['base', 'web', 'mail']
+
+    def test_load_order_subset_errors(self):
+        """Test cycles and missing dependencies in a module subset"""
+        loader = self._loader({'a': ['b'], 'b': ['a'], 'c': ['missing']})
+
+        with pytest.raises(CircularDependencyError):
+            loader.get_load_order(['a'])
+        with pytest.raises(MissingDependencyError):
+            loader.get_load_order(['c'])
+
+
 def test_module_state_enum():
     """Test ModuleState enum"""
     assert ModuleState.UNINSTALLED == "uninstalled"
@@ -1,10 +1,11 @@
 """
 Tests for ORM domain expression parser
 """
+import sys
 import pytest
 
 from openflow.server.core.orm import (
-    Model, fields, DomainParser, normalize_domain, domain_to_sql
+    Model, fields, DomainParser, normalize_domain, domain_shape, domain_to_sql
 )
 
 
@@ -232,6 +233,22 @@ class TestDomainToSQL:
         assert 25 in params
         assert 30 in params
 
+    def test_in_params_do_not_alias_domain(self):
+        """Test mutating the domain's list after to_sql leaves params alone"""
+        ages = [18, 25]
+        names = ['a', 'b']
+        domain = [('age', 'in', ages), ('name', 'not in', names)]
+
+        _, params = DomainParser(domain).to_sql(TestModel, 'test_model')
+        _, cached_params = domain_to_sql(domain, TestModel, 'test_model')
+        _, leaf_params = DomainParser([('age', 'in', ages)]).to_sql(TestModel, 'test_model')
+        ages.append(30)
+        names.clear()
+
+        assert params == [18, 25, 'a', 'b']
+        assert cached_params == [18, 25, 'a', 'b']
+        assert leaf_params == [18, 25]
+
     def test_in_operator_empty(self):
         """Test IN operator with empty list"""
         domain = [('age', 'in', [])]
@@ -320,6 +337,40 @@ class TestDomainLogicalOperators:
         assert 'NOT' in sql
         assert 'active' in sql
 
+    def test_and_chain_is_flattened(self):
+        """Test a chain of ANDs is emitted as one flat conjunction"""
+        domain = [('name', '=', 'a'), ('age', '>', 1), ('active', '=', True), ('email', '=', 'e')]
+        sql, params = DomainParser(domain).to_sql(TestModel, 't')
+
+        assert sql == '(t.name = %s) AND (t.age > %s) AND (t.active = %s) AND (t.email = %s)'
+        assert params == ['a', 1, True, 'e']
+
+    def test_mixed_operators_not_flattened(self):
+        """Test OR below AND keeps its own parentheses"""
+        domain = ['&', '&', ('name', '=', 'a'), '|', ('age', '>', 1), ('age', '<', 0), ('active', '=', True)]
+        sql, params = DomainParser(domain).to_sql(TestModel, 't')
+
+        assert sql == '(t.name = %s) AND (t.active = %s) AND ((t.age > %s) OR (t.age < %s))'
+        assert params == ['a', True, 1, 0]
+
+    def test_and_operands_ordered_by_cost(self):
+        """Test cheap conjuncts are emitted before expensive ones"""
+        domain = [
+            ('name', 'ilike', 'jo%'),
+            ('email', 'like', '%@x.org'),
+            ('age', 'in', list(range(20))),
+            ('age', 'in', [1, 2]),
+            ('active', '=', True),
+        ]
+        sql, params = DomainParser(domain).to_sql(TestModel, 't')
+
+        assert sql.index('t.active =') < sql.index('t.age IN (%s, %s)')
+        assert sql.index('t.age IN (%s, %s)') < sql.index('t.email LIKE')
+        assert sql.index('t.email LIKE') < sql.index('t.name ILIKE')
+        assert sql.index('t.name ILIKE') < sql.rindex('t.age IN')
+        assert params[:3] == [True, 1, 2]
+        assert domain_to_sql(domain, TestModel, 't') == (sql, params)
+
     def test_complex_logic(self):
         """Test complex logical combination"""
         domain = [
@@ -375,6 +426,19 @@ class TestDomainErrors:
         with pytest.raises(ValueError, match="not found"):
             parser.to_sql(TestModel, 'test_model')
 
+    def test_non_field_attribute(self):
+        """Test model attributes that are not fields are rejected"""
+        parser = DomainParser([('search', '=', 'value')])
+
+        with pytest.raises(ValueError, match="not found"):
+            parser.to_sql(TestModel, 'test_model')
+
+    def test_implicit_id_field(self):
+        """Test the metaclass-added id field is accepted"""
+        sql, params = DomainParser([('id', '=', 1)]).to_sql(TestModel, 'test_model')
+        assert sql == 'test_model.id = %s'
+        assert params == [1]
+
     def test_invalid_operator(self):
         """Test error for invalid operator"""
         domain = [('name', 'invalid_op', 'value')]
@@ -430,6 +494,22 @@ class TestDomainEdgeCases:
         # Should parse without errors
         assert ast.operator == '&'
 
+    def test_deep_domain_beyond_recursion_limit(self):
+        """Test parsing a domain nested deeper than the recursion limit"""
+        depth = sys.getrecursionlimit() + 100
+        domain = ['!'] * depth + [('active', '=', True)]
+
+        node = DomainParser(domain).parse()
+        for _ in range(depth):
+            assert node.operator == '!'
+            node = node.children[0]
+        assert node.field == 'active'
+
+    def test_unexpected_end_of_domain(self):
+        """Test error for an operator missing operands"""
+        with pytest.raises(ValueError, match="Unexpected end of domain"):
+            DomainParser(['&', ('a', '=', 1)]).parse()
+
     def test_multiple_implicit_ands(self):
         """Test multiple conditions with implicit ANDs"""
         domain = [
@@ -446,5 +526,133 @@ class TestDomainEdgeCases:
         assert and_count == 3
 
 
+class TestDomainSimplification:
+    """Test constant folding of empty 'in' / 'not in' leaves"""
+
+    def test_and_with_empty_in_is_false(self):
+        """Test AND with an always-false operand folds to FALSE"""
+        domain = [('name', '=', 'John'), ('age', 'in', []), ('active', '=', True)]
+        sql, params = DomainParser(domain).to_sql(TestModel, 't')
+
+        assert sql == 'FALSE'
+        assert params == []
+
+    def test_or_with_empty_not_in_is_true(self):
+        """Test OR with an always-true operand folds to TRUE"""
+        domain = ['|', ('name', '=', 'John'), ('age', 'not in', [])]
+        sql, params = DomainParser(domain).to_sql(TestModel, 't')
+
+        assert sql == 'TRUE'
+        assert params == []
+
+    def test_neutral_operands_are_dropped(self):
+        """Test TRUE operands of AND are dropped with their parameters"""
+        domain = ['&', '&', ('age', 'not in', []), '!', ('name', 'in', []), ('email', '=', 'a@b.c')]
+        expected = ('t.email = %s', ['a@b.c'])
+
+        assert DomainParser(domain).to_sql(TestModel, 't') == expected
+        assert domain_to_sql(domain, TestModel, 't') == expected
+
+    def test_cached_sql_drops_folded_params(self):
+        """Test parameters of folded leaves are dropped on cache hits too"""
+        domain = ['|', '&', ('age', 'in', []), ('name', '=', 'x'), ('email', '=', 'y')]
+
+        assert domain_to_sql(domain, TestModel, 't') == ('t.email = %s', ['y'])
+        domain[3] = ('name', '=', 'z')
+        assert domain_to_sql(domain, TestModel, 't') == ('t.email = %s', ['y'])
+
+    def test_not_is_absorbed_into_leaf(self):
+        """Test NOT of an invertible comparison becomes the inverse operator"""
+        assert DomainParser(['!', ('age', '>', 18)]).to_sql(TestModel, 't') == ('t.age <= %s', [18])
+        assert DomainParser(['!', ('age', 'in', [1, 2])]).to_sql(TestModel, 't') == (
+            't.age NOT IN (%s, %s)', [1, 2]
+        )
+
+    def test_not_is_pushed_through_and(self):
+        """Test De Morgan turns NOT (a AND b) into (NOT a) OR (NOT b)"""
+        domain = ['!', '&', ('name', '=', 'John'), ('email', 'ilike', 'x%')]
+        sql, params = DomainParser(domain).to_sql(TestModel, 't')
+
+        assert sql == '(t.name != %s) OR (NOT (t.email ILIKE %s))'
+        assert params == ['John', 'x%']
+
+    def test_double_not_cancels(self):
+        """Test NOT NOT of a non-invertible leaf leaves the plain leaf"""
+        domain = ['!', '!', ('email', 'like', 'x%')]
+        assert DomainParser(domain).to_sql(TestModel, 't') == ('t.email LIKE %s', ['x%'])
+
+
+class TestDomainShape:
+    """Test domain shape extraction used for SQL caching"""
+
+    def test_same_shape_different_literals(self):
+        """Test domains differing only in literals share a shape"""
+        shape1, params1 = domain_shape([('name', '=', 'John'), ('age', '>', 18)])
+        shape2, params2 = domain_shape([('name', '=', 'Jane'), ('age', '>', 30)])
+
+        assert shape1 == shape2
+        assert params1 == ['John', 18]
+        assert params2 == ['Jane', 30]
+
+    def test_null_comparison_changes_shape(self):
+        """Test NULL comparisons are part of the shape"""
+        shape1, params1 = domain_shape([('name', '=', False)])
+        shape2, _ = domain_shape([('name', '=', 'John')])
+
+        assert shape1 != shape2
+        assert params1 == []
+
+    def test_in_length_changes_shape(self):
+        """Test 'in' list length is part of the shape"""
+        shape1, params1 = domain_shape([('age', 'in', [1, 2])])
+        shape2, _ = domain_shape([('age', 'in', [1, 2, 3])])
+
+        assert shape1 != shape2
+        assert params1 == [1, 2]
+
+    def test_params_match_sql(self):
+        """Test parameters come out in placeholder order"""
+        domain = ['|', ('name', '=', 'John'), '&', ('age', 'in', [1, 2]), ('email', '!=', None)]
+        _, params = domain_shape(domain)
+        _, sql_params = domain_to_sql(domain, TestModel, 'test_model')
+
+        assert params == sql_params
+
+    def test_malformed_leaf(self):
+        """Test error for malformed leaf"""
+        with pytest.raises(ValueError, match="Invalid domain leaf"):
+            domain_shape([('name', '=')])
+
+    def test_domain_to_sql_matches_parser(self):
+        """Test compiled shapes give the same SQL and params as the parser"""
+        domains = [
+            [('name', '=', 'John'), ('age', '>', 18)],
+            ['|', ('name', '=', False), ('age', 'in', [1, 2, 3])],
+            ['!', ('age', 'not in', [])],
+        ]
+        for domain in domains:
+            expected = DomainParser(domain).to_sql(TestModel, 'test_model')
+            assert domain_to_sql(domain, TestModel, 'test_model') == expected
+
+    def test_domain_to_sql_reuses_compiled_shape(self):
+        """Test a repeated shape is served from the compile cache"""
+        from openflow.server.core.orm.domain import _compile_shape
+
+        domain_to_sql([('email', 'ilike', 'a%')], TestModel, 'cached')
+        hits = _compile_shape.cache_info().hits
+        sql, params = domain_to_sql([('email', 'ilike', 'b%')], TestModel, 'cached')
+
+        assert _compile_shape.cache_info().hits == hits + 1
+        assert sql == 'cached.email ILIKE %s'
+        assert params == ['b%']
+
+    def test_domain_to_sql_rebinds_reordered_params(self):
+        """Test a cached reordered shape binds each call's own values"""
+        for name, age in (('John', 18), ('Jane', 30)):
+            domain = [('email', 'ilike', name), ('age', '>', age)]
+            expected = DomainParser(domain).to_sql(TestModel, 'test_model')
+            assert domain_to_sql(domain, TestModel, 'test_model') == expected
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
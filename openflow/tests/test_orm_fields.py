@@ -151,6 +151,12 @@ class TestDateTimeFields:
         result = f.convert_to_cache('2024-01-15T10:30:00')
         assert isinstance(result, datetime)
 
+        result = f.convert_to_cache('2024-01-15 10:30:00.250000')
+        assert result.microsecond == 250000
+
+        with pytest.raises(ValueError, match="Cannot parse datetime"):
+            f.convert_to_cache('15/01/2024')
+
     def test_date_to_database(self):
         """Test date conversion to database format"""
         f = fields.Date()
@@ -313,5 +319,41 @@ class TestFieldColumnTypes:
         assert fields.Many2one('test')._column_type == 'INTEGER'
 
 
+class TestColumnConversion:
+    """Test converting whole columns for the cache"""
+
+    def test_integer_column(self):
+        """Test Integer column conversion keeps NULLs"""
+        f = fields.Integer()
+        assert f.convert_column_to_cache(['1', 2, 3.0]) == [1, 2, 3]
+        assert f.convert_column_to_cache([1, None, '3']) == [1, None, 3]
+
+    def test_float_column(self):
+        """Test Float column conversion keeps NULLs"""
+        f = fields.Float()
+        assert f.convert_column_to_cache([1, '2.5']) == [1.0, 2.5]
+        assert f.convert_column_to_cache([None, 1]) == [None, 1.0]
+
+    def test_boolean_column(self):
+        """Test Boolean column conversion maps NULL to False"""
+        f = fields.Boolean()
+        assert f.convert_column_to_cache([1, 0, None]) == [True, False, False]
+
+    def test_datetime_column(self):
+        """Test DateTime column conversion with mixed inputs"""
+        f = fields.DateTime()
+        expected = datetime(2024, 1, 15, 10, 30, 0)
+        assert f.convert_column_to_cache(['2024-01-15T10:30:00']) == [expected]
+        assert f.convert_column_to_cache(['2024-01-15 10:30:00', None, expected]) == [
+            expected, None, expected
+        ]
+
+    def test_column_matches_per_value(self):
+        """Test default column conversion matches convert_to_cache"""
+        f = fields.Date()
+        values = ['2024-01-15', None]
+        assert f.convert_column_to_cache(values) == [f.convert_to_cache(v) for v in values]
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -1,9 +1,12 @@
 """
 Tests for ORM Model class and RecordSet
 """
+import operator
+from datetime import date, datetime
+
 import pytest
 
-from openflow.server.core.orm import Model, fields, RecordSet, registry
+from openflow.server.core.orm import Model, fields, RecordSet, registry, get_env
 
 
 class TestModelDefinition:
@@ -36,6 +39,17 @@ class TestModelDefinition:
         assert 'test.product' in registry
         assert registry['test.product'] == Product
 
+    def test_registration_copy_on_write(self):
+        """Test registering a model publishes a new mapping"""
+        models = registry._models
+
+        class Service(Model):
+            _name = 'test.service'
+
+        assert registry._models is not models
+        assert 'test.service' not in models
+        assert registry['test.service'] is Service
+
     def test_auto_id_field(self):
         """Test ID field is auto-added"""
         class Simple(Model):
@@ -180,6 +194,30 @@ class TestRecordSet:
         result3 = rs1 | rs2
         assert result3 == result
 
+    def test_recordset_union_cache(self):
+        """Test union reuses a shared cache and sees both sides' values"""
+        cache = {'name': {1: 'Alice'}}
+        rs1 = RecordSet(self.Partner, [1], cache)
+        rs2 = RecordSet(self.Partner, [2], cache)
+        assert (rs1 + rs2)._cache is cache
+
+        rs3 = RecordSet(self.Partner, [3], {'name': {3: 'Carol'}})
+        assert (rs1 + rs3).mapped('name') == ['Alice', 'Carol']
+
+    def test_recordset_mixed_models(self):
+        """Test set operations across models defer to Python's fallback"""
+        class OtherModel(Model):
+            _name = 'test.recordset.other'
+
+        rs1 = RecordSet(self.Partner, [1])
+        rs2 = RecordSet(OtherModel, [1])
+
+        assert rs1 != rs2
+        assert rs1 != [1]
+        for op in (operator.add, operator.sub, operator.and_, operator.or_):
+            with pytest.raises(TypeError):
+                op(rs1, rs2)
+
     def test_recordset_difference(self):
         """Test recordset difference (-)"""
         rs1 = RecordSet(self.Partner, [1, 2, 3, 4])
@@ -219,15 +257,12 @@ class TestRecordSet:
         # Create recordset with cache
         rs = RecordSet(self.Partner, [1, 2, 3, 4])
         rs._cache = {
-            (1, 'age'): 18,
-            (2, 'age'): 25,
-            (3, 'age'): 30,
-            (4, 'age'): 15,
+            'age': {1: 18, 2: 25, 3: 30, 4: 15},
         }
 
         # Filter by function
         def older_than_20(record):
-            age = record._cache.get((record.id, 'age'), 0)
+            age = record._cache.get('age', {}).get(record.id, 0)
             return age > 20
 
         result = rs.filtered(older_than_20)
@@ -249,15 +284,12 @@ class TestRecordSet:
         """Test mapped method"""
         rs = RecordSet(self.Partner, [1, 2, 3])
         rs._cache = {
-            (1, 'name'): 'Alice',
-            (2, 'name'): 'Bob',
-            (3, 'name'): 'Charlie',
+            'name': {1: 'Alice', 2: 'Bob', 3: 'Charlie'},
         }
 
-        # Map to field values
-        # Note: This is a simplified test, actual implementation needs more work
-        # names = rs.mapped('name')
-        # assert names == ['Alice', 'Bob', 'Charlie']
+        # Map to field values, served from the cache
+        names = rs.mapped('name')
+        assert names == ['Alice', 'Bob', 'Charlie']
 
     def test_recordset_repr(self):
         """Test string representation"""
@@ -351,6 +383,34 @@ class TestModelDescription:
         assert MyModel._description == 'My Test Model'
 
 
+class TestEnvironmentModels:
+    """Test model lookup through the environment"""
+
+    def test_bound_model_cached(self):
+        """Test env[name] reuses the bound model until invalidated"""
+        class Ledger(Model):
+            _name = 'test.env.ledger'
+
+        env = get_env()
+        bound = env['test.env.ledger']
+        assert isinstance(bound, Ledger)
+        assert bound._env is env
+        assert env['test.env.ledger'] is bound
+
+        env.invalidate_cache()
+        assert env['test.env.ledger'] is not bound
+
+    def test_access_controller_shared(self):
+        """Test the environment reuses its access controller per user"""
+        env = get_env()
+        access = env.access
+        assert env.access is access
+
+        env.user = object()
+        assert env.access is not access
+        assert env.access.user is env.user
+
+
 class TestModelBrowse:
     """Test browse method"""
 
@@ -400,6 +460,18 @@ class TestFieldAccess:
         assert name_field.required is True
         assert isinstance(name_field, fields.Char)
 
+    def test_field_value_from_cache(self):
+        """Test field attributes read and write the per-field cache"""
+        class TestModel(Model):
+            _name = 'test.fields.cache'
+            name = fields.Char()
+
+        record = TestModel([7])
+        record.name = 'Alice'
+
+        assert record._cache == {'name': {7: 'Alice'}}
+        assert record.name == 'Alice'
+
 
 class TestModelInheritance:
     """Test model inheritance attributes"""
@@ -430,5 +502,343 @@ class TestModelInheritance:
         assert 'test.company' in User._inherits
 
 
+
+class TestModelCreate:
+    """Test creating records against an in-memory database"""
+
+    async def test_create_groups_and_pages_in_input_order(self):
+        """Test ids map back to input records across column groups and pages"""
+        pytest.importorskip('aiosqlite')
+        from sqlalchemy import event, text
+        from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+        class Contact(Model):
+            _name = 'test.create.contact'
+            name = fields.Char()
+            birthday = fields.Date()
+            parent_id = fields.Many2one('test.create.contact')
+
+        # Small pages split each column group over several INSERTs where
+        # the dialect batches sorted RETURNING (SQLite runs them row by row)
+        engine = create_async_engine('sqlite+aiosqlite://', insertmanyvalues_page_size=2)
+        await Contact._create_table(engine)
+
+        inserts = []
+
+        @event.listens_for(engine.sync_engine, 'before_cursor_execute')
+        def count_inserts(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith('INSERT'):
+                inserts.append(statement.split(')')[0])
+
+        birthday = date(1990, 1, 1)
+        vals = [
+            {'name': 'a'},
+            {'name': 'b', 'birthday': birthday},
+            {'name': 'c'},
+            {'name': 'd', 'parent_id': 1},
+            {'name': 'e', 'birthday': birthday},
+            {'name': 'f'},
+            {'name': 'g', 'birthday': birthday},
+        ]
+        async with AsyncSession(engine) as session:
+            created = await Contact.with_env(get_env(session=session)).create(vals)
+            rows = dict((await session.execute(
+                text("SELECT id, name FROM test_create_contact")
+            )).all())
+
+        assert len(created) == len(vals)
+        assert [rows[record_id] for record_id in created.ids] == [v['name'] for v in vals]
+        # One column list per group, never mixed within a statement
+        assert len(set(inserts)) == 3
+        await engine.dispose()
+
+
+
+class TestModelWriteMany:
+    """Test per-record updates with write_many"""
+
+    def _model(self):
+        class Ticket(Model):
+            _name = 'test.write.ticket'
+            name = fields.Char()
+            priority = fields.Integer()
+            code = fields.Char(readonly=True)
+            summary = fields.Char(compute='_compute_summary', store=False)
+        return Ticket
+
+    async def test_write_many_batches_runs_with_same_fields(self):
+        """Test consecutive rows with the same keys share one UPDATE"""
+        pytest.importorskip('aiosqlite')
+        from sqlalchemy import event, text
+        from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+        Ticket = self._model()
+        engine = create_async_engine('sqlite+aiosqlite://')
+        await Ticket._create_table(engine)
+
+        updates = []
+
+        @event.listens_for(engine.sync_engine, 'before_cursor_execute')
+        def count_updates(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith('UPDATE'):
+                updates.append(statement)
+
+        async with AsyncSession(engine) as session:
+            await session.execute(text(
+                "INSERT INTO test_write_ticket (name, priority) "
+                "VALUES ('a', 0), ('b', 0), ('c', 0), ('d', 0)"
+            ))
+            tickets = Ticket.with_env(get_env(session=session))
+            await tickets.write_many([
+                {'id': 1, 'name': 'A'},
+                {'id': 2, 'name': 'B'},
+                {'id': 3, 'priority': 5},
+                {'id': 4, 'name': 'D'},
+            ])
+            records = await tickets.search_read(fields=['name', 'priority'], order='id')
+
+        assert len(updates) == 3
+        assert [(r['name'], r['priority']) for r in records] == [
+            ('A', 0), ('B', 0), ('c', 5), ('D', 0),
+        ]
+        # Values written are cached for the records
+        assert tickets._cache['name'] == {1: 'A', 2: 'B', 3: 'c', 4: 'D'}
+        assert tickets._cache['priority'] == {1: 0, 2: 0, 3: 5, 4: 0}
+        await engine.dispose()
+
+    async def test_write_many_updates_record_cache(self):
+        """Test written values replace those already in the record cache"""
+        pytest.importorskip('aiosqlite')
+        from sqlalchemy import text
+        from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+        Ticket = self._model()
+        engine = create_async_engine('sqlite+aiosqlite://')
+        await Ticket._create_table(engine)
+
+        async with AsyncSession(engine) as session:
+            await session.execute(text(
+                "INSERT INTO test_write_ticket (name, priority) VALUES ('a', 1), ('b', 2)"
+            ))
+            tickets = Ticket.with_env(get_env(session=session))
+            await tickets.search_read(order='id')
+            await tickets.write_many([{'id': 2, 'priority': 7}])
+
+        assert tickets._cache['priority'] == {1: 1, 2: 7}
+        assert RecordSet(Ticket, [1, 2], tickets._cache).mapped('name') == ['a', 'b']
+        await engine.dispose()
+
+    async def test_write_many_rejects_readonly_field(self):
+        """Test writing a readonly field raises before any SQL"""
+        Ticket = self._model()
+        tickets = Ticket.with_env(get_env())
+
+        with pytest.raises(ValueError, match="'code' is readonly"):
+            await tickets.write_many([{'id': 1, 'name': 'a'}, {'id': 2, 'code': 'X'}])
+
+    async def test_write_many_requires_id(self):
+        """Test every row must name its record"""
+        Ticket = self._model()
+        tickets = Ticket.with_env(get_env())
+
+        with pytest.raises(ValueError, match="needs an 'id'"):
+            await tickets.write_many([{'id': 1, 'name': 'a'}, {'name': 'b'}])
+
+    async def test_write_many_rejects_fields_without_column(self):
+        """Test unknown and non-stored keys never reach the SQL text"""
+        Ticket = self._model()
+        tickets = Ticket.with_env(get_env())
+
+        with pytest.raises(ValueError, match="'summary' is not a stored field"):
+            await tickets.write_many([{'id': 1, 'summary': 'x'}])
+        with pytest.raises(ValueError, match="is not a stored field"):
+            await tickets.write_many([{'id': 1, 'name = name; --': 'x'}])
+
+
+class TestModelRead:
+    """Test reading records against an in-memory database"""
+
+    async def test_search_read_converts_columns_into_cache(self):
+        """Test fetched columns are converted per field and cached"""
+        pytest.importorskip('aiosqlite')
+        from sqlalchemy import text
+        from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+        class Gadget(Model):
+            _name = 'test.read.gadget'
+            name = fields.Char()
+            weight = fields.Float()
+            active = fields.Boolean()
+
+        engine = create_async_engine('sqlite+aiosqlite://')
+        await Gadget._create_table(engine)
+
+        async with AsyncSession(engine) as session:
+            await session.execute(text(
+                "INSERT INTO test_read_gadget (name, weight, active) "
+                "VALUES ('a', 2, 1), ('b', 3, NULL)"
+            ))
+            gadgets = Gadget.with_env(get_env(session=session))
+            records = await gadgets.search_read(order='id')
+
+        assert records == [
+            {'id': 1, 'name': 'a', 'weight': 2.0, 'active': True},
+            {'id': 2, 'name': 'b', 'weight': 3.0, 'active': False},
+        ]
+        assert type(records[0]['weight']) is float
+        assert gadgets._cache['active'] == {1: True, 2: False}
+        assert RecordSet(Gadget, [1, 2], gadgets._cache).mapped('name') == ['a', 'b']
+        await engine.dispose()
+
+    async def test_search_read_parses_datetime_column(self):
+        """Test a text-backed DateTime column is parsed into datetimes"""
+        pytest.importorskip('aiosqlite')
+        from sqlalchemy import text
+        from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+        class Visit(Model):
+            _name = 'test.read.visit'
+            at = fields.DateTime()
+
+        engine = create_async_engine('sqlite+aiosqlite://')
+        await Visit._create_table(engine)
+
+        async with AsyncSession(engine) as session:
+            await session.execute(text(
+                "INSERT INTO test_read_visit (at) "
+                "VALUES ('2024-01-15 10:30:00'), ('2024-01-16T08:00:00.250000'), (NULL)"
+            ))
+            visits = Visit.with_env(get_env(session=session))
+            records = await visits.search_read(fields=['at'], order='id')
+
+        assert [record['at'] for record in records] == [
+            datetime(2024, 1, 15, 10, 30),
+            datetime(2024, 1, 16, 8, 0, 0, 250000),
+            None,
+        ]
+        await engine.dispose()
+
+    async def test_search_read_resolves_related_per_hop(self):
+        """Test a related path costs one query per hop and fills the cache"""
+        pytest.importorskip('aiosqlite')
+        from sqlalchemy import event, text
+        from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+        class Company(Model):
+            _name = 'test.related.company'
+            name = fields.Char()
+
+        class Partner(Model):
+            _name = 'test.related.partner'
+            company_id = fields.Many2one('test.related.company')
+
+        class Contact(Model):
+            _name = 'test.related.contact'
+            name = fields.Char()
+            partner_id = fields.Many2one('test.related.partner')
+            company_name = fields.Char(related='partner_id.company_id.name', store=False)
+
+        engine = create_async_engine('sqlite+aiosqlite://')
+        for model in (Company, Partner, Contact):
+            await model._create_table(engine)
+
+        selects = []
+
+        @event.listens_for(engine.sync_engine, 'before_cursor_execute')
+        def count_selects(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith('SELECT'):
+                selects.append(statement)
+
+        async with AsyncSession(engine) as session:
+            await session.execute(text(
+                "INSERT INTO test_related_company (name) VALUES ('Acme'), ('Globex')"
+            ))
+            await session.execute(text(
+                "INSERT INTO test_related_partner (company_id) VALUES (1), (2), (1)"
+            ))
+            await session.execute(text(
+                "INSERT INTO test_related_contact (name, partner_id) "
+                "VALUES ('a', 1), ('b', 2), ('c', 3), ('d', NULL), ('e', 1)"
+            ))
+            contacts = Contact.with_env(get_env(session=session))
+            records = await contacts.search_read(fields=['name', 'company_name'], order='id')
+            hop_selects = len(selects) - 1
+
+            # The first hop comes from the cache once partner_id was read
+            selects.clear()
+            await contacts.search_read(fields=['partner_id', 'company_name'], order='id')
+
+        assert [(r['name'], r['company_name']) for r in records] == [
+            ('a', 'Acme'), ('b', 'Globex'), ('c', 'Acme'), ('d', None), ('e', 'Acme'),
+        ]
+        assert hop_selects == 3
+        assert len(selects) == 3
+        assert contacts._cache['partner_id'] == {1: 1, 2: 2, 3: 3, 4: None, 5: 1}
+        assert RecordSet(Contact, [1, 2, 4], contacts._cache).mapped('company_name') == [
+            'Acme', 'Globex', None,
+        ]
+        await engine.dispose()
+
+
+
+class TestReadBatch:
+    """Test reading several models with read_batch"""
+
+    async def test_read_batch_with_explicit_session(self):
+        """Test each model is read in turn through the environment's session"""
+        pytest.importorskip('aiosqlite')
+        from sqlalchemy import event, text
+        from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+        from openflow.server.core.orm import read_batch
+
+        class Author(Model):
+            _name = 'test.batch.author'
+            name = fields.Char()
+
+        class Book(Model):
+            _name = 'test.batch.book'
+            title = fields.Char()
+            pages = fields.Integer()
+
+        class Shelf(Model):
+            _name = 'test.batch.shelf'
+            label = fields.Char()
+
+        engine = create_async_engine('sqlite+aiosqlite://')
+        for model in (Author, Book, Shelf):
+            await model._create_table(engine)
+
+        selects = []
+
+        @event.listens_for(engine.sync_engine, 'before_cursor_execute')
+        def count_selects(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith('SELECT'):
+                selects.append(statement)
+
+        async with AsyncSession(engine) as session:
+            await session.execute(text(
+                "INSERT INTO test_batch_author (name) VALUES ('Ann'), ('Bob'), ('Cy')"
+            ))
+            await session.execute(text(
+                "INSERT INTO test_batch_book (title, pages) VALUES ('X', 10), ('Y', 20)"
+            ))
+            result = await read_batch(
+                get_env(session=session),
+                {Author: [1, 3], Book: [2], Shelf: []},
+                {Book: ['title']},
+            )
+
+        assert list(result) == [Author, Book, Shelf]
+        assert sorted(result[Author], key=operator.itemgetter('id')) == [
+            {'id': 1, 'name': 'Ann'},
+            {'id': 3, 'name': 'Cy'},
+        ]
+        assert result[Book] == [{'id': 2, 'title': 'Y'}]
+        assert result[Shelf] == []
+        # One SELECT per model with records to read
+        assert len(selects) == 2
+        await engine.dispose()
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
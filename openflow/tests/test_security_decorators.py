@@ -0,0 +1,106 @@
+"""
+Tests for security decorators
+"""
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from openflow.server.core.security import AccessDenied, rate_limit
+
+
+def _caller(user_id=7):
+    """Object shaped like a model bound to an environment with a user"""
+    return SimpleNamespace(env=SimpleNamespace(user=SimpleNamespace(id=user_id)))
+
+
+class TestRateLimit:
+    """Test rate_limit decorator"""
+
+    def test_rejects_at_max_calls(self, monkeypatch):
+        """Test the call after max_calls within the period is rejected"""
+        monkeypatch.setattr(time, 'monotonic', lambda: 1000.0)
+
+        @rate_limit(max_calls=3, period_seconds=60)
+        def send(self):
+            return 'sent'
+
+        caller = _caller()
+        assert [send(caller) for _ in range(3)] == ['sent'] * 3
+        with pytest.raises(AccessDenied, match='3 calls per 60 seconds'):
+            send(caller)
+
+    def test_accepts_after_period(self, monkeypatch):
+        """Test calls are accepted again once period_seconds have passed"""
+        clock = [1000.0]
+        monkeypatch.setattr(time, 'monotonic', lambda: clock[0])
+
+        @rate_limit(max_calls=2, period_seconds=60)
+        def send(self):
+            return 'sent'
+
+        caller = _caller()
+        send(caller)
+        clock[0] += 30
+        send(caller)
+
+        clock[0] += 29.5
+        with pytest.raises(AccessDenied):
+            send(caller)
+
+        # The first call expires after exactly period_seconds
+        clock[0] += 0.5
+        assert send(caller) == 'sent'
+        with pytest.raises(AccessDenied):
+            send(caller)
+
+    def test_limits_each_user_separately(self, monkeypatch):
+        """Test one user's calls do not count against another's"""
+        monkeypatch.setattr(time, 'monotonic', lambda: 1000.0)
+
+        @rate_limit(max_calls=1, period_seconds=60)
+        def send(self):
+            return 'sent'
+
+        send(_caller(1))
+        assert send(_caller(2)) == 'sent'
+        with pytest.raises(AccessDenied):
+            send(_caller(1))
+
+    def test_concurrent_calls_never_exceed_max_calls(self, monkeypatch):
+        """Test threads calling with one key are admitted at most max_calls times"""
+        monkeypatch.setattr(time, 'monotonic', lambda: 1000.0)
+        # Switch threads as often as possible to provoke interleaving
+        previous_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+        @rate_limit(max_calls=5, period_seconds=60)
+        def send(self):
+            return 'sent'
+
+        caller = _caller()
+        barrier = threading.Barrier(16)
+        admitted = []
+        rejected = []
+
+        def worker():
+            barrier.wait()
+            for _ in range(20):
+                try:
+                    admitted.append(send(caller))
+                except AccessDenied:
+                    rejected.append(1)
+
+        threads = [threading.Thread(target=worker) for _ in range(16)]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(previous_interval)
+
+        assert len(admitted) == 5
+        assert len(rejected) == 16 * 20 - 5